@@ -4,25 +4,86 @@ Waypoints Workflow - Configuration Reader
 
 Library for reading values from JSON configuration files using dot-notation paths.
 Used by wp_config.py to read profile settings.
+
+Parsed files are flattened into a dotted-key index (every dict along the way
+is indexed under its own prefix too) and cached per (path, inode, mtime, size),
+so a lookup against an unchanged file is a single dict access. orjson is used
+for parsing when installed, falling back to the stdlib json module.
 """
 
 import json
+import os
+from typing import Any, BinaryIO, Dict, Optional, Tuple, Union
 
+try:
+    import orjson
+    _loads = orjson.loads
+    HAS_ORJSON = True
+except ImportError:
+    _loads = json.loads
+    HAS_ORJSON = False
 
-def get_config_value(path: str, config_file: str):
-    """Read a value from JSON config using dot-notation path. Returns the value or None."""
-    parts = path.split('.')
+_CACHE_MAX_ENTRIES = 64
+
+# (abs path, inode, mtime_ns, size) -> flattened dotted-key index
+_PARSED_CACHE: Dict[Tuple[str, int, int, int], Dict[str, Any]] = {}
+
+
+def _flatten(obj: Any, prefix: Optional[str] = None, index: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    Flatten nested dicts into {"a.b.c": value} entries.
+
+    Intermediate dicts are indexed too, so "a.b" returns the subtree. Lists are
+    leaves. Keys containing "." are skipped since a dotted path can never
+    address them.
+    """
+    if index is None:
+        index = {}
+    if not isinstance(obj, dict):
+        return index
+
+    for key, value in obj.items():
+        if not isinstance(key, str) or "." in key:
+            continue
+        dotted = key if prefix is None else f"{prefix}.{key}"
+        index[dotted] = value
+        _flatten(value, dotted, index)
+    return index
 
-    try:
-        with open(config_file, 'r') as f:
-            data = json.load(f)
 
-        for part in parts:
-            if isinstance(data, dict):
-                data = data.get(part)
-            else:
-                return None
+def _parse(raw: bytes) -> Dict[str, Any]:
+    """Parse raw JSON config bytes into a dotted-key index. Raises on invalid JSON."""
+    return _flatten(_loads(raw))
 
-        return data
+
+def _load_config(config_file: str) -> Dict[str, Any]:
+    """Load a JSON config file as a dotted-key index, reusing the cache if unchanged."""
+    st = os.stat(config_file)
+    key = (os.path.abspath(config_file), st.st_ino, st.st_mtime_ns, st.st_size)
+    if key in _PARSED_CACHE:
+        return _PARSED_CACHE[key]
+
+    with open(config_file, 'rb') as f:
+        index = _parse(f.read())
+
+    if len(_PARSED_CACHE) >= _CACHE_MAX_ENTRIES:
+        _PARSED_CACHE.pop(next(iter(_PARSED_CACHE)))
+    _PARSED_CACHE[key] = index
+    return index
+
+
+def get_config_value(path: str, config_file: Union[str, os.PathLike, BinaryIO]):
+    """
+    Read a value from JSON config using dot-notation path. Returns the value or None.
+
+    config_file is a file path, or a binary file-like object which is read
+    and parsed directly (bypassing the parse cache). Dict and list values
+    read from a path are shared with the parse cache; callers must not
+    mutate them.
+    """
+    try:
+        if hasattr(config_file, 'read'):
+            return _parse(config_file.read()).get(path)
+        return _load_config(config_file).get(path)
     except Exception:
         return None
@@ -96,11 +96,7 @@ Review the failing tests and continue implementing the business logic."""
 # Phase Guard Formatters (PreToolUse Blocks)
 # =============================================================================
 
-def format_phase_guard_phase1_block(file_path: str, profile_name: str, marker_dir: str = "") -> str:
-    """Format Phase 1 block message for source file edit attempt."""
-    mark_cmd = "true # wp:mark-complete requirements"
-
-    return f"""## WP Phase 1: Requirements Gathering ({profile_name})
+PHASE_GUARD_PHASE1_TEMPLATE = """## WP Phase 1: Requirements Gathering ({profile_name})
 
 **Blocked:** Cannot edit `{file_path}`
 
@@ -112,17 +108,12 @@ You are in **Phase 1 (Requirements)**. No source code changes are allowed yet.
 3. Get user confirmation
 4. Mark requirements complete:
    ```bash
-   {mark_cmd}
+   true # wp:mark-complete requirements
    ```
 
 Then you can proceed to Phase 2 (Interface Design)."""
 
-
-def format_phase_guard_phase2_block(file_path: str, profile_name: str, marker_dir: str = "") -> str:
-    """Format Phase 2 block message for test file edit attempt."""
-    mark_cmd = "true # wp:mark-complete interfaces"
-
-    return f"""## WP Phase 2: Interface Design ({profile_name})
+PHASE_GUARD_PHASE2_TEMPLATE = """## WP Phase 2: Interface Design ({profile_name})
 
 **Blocked:** Cannot edit `{file_path}`
 
@@ -137,17 +128,12 @@ You are in **Phase 2 (Interfaces)**. Test files cannot be edited yet.
 6. Present interfaces to user for approval
 5. Mark interfaces complete:
    ```bash
-   {mark_cmd}
+   true # wp:mark-complete interfaces
    ```
 
 **After marking complete**, you'll advance to Phase 3 (Tests)."""
 
-
-def format_phase_guard_phase3_block(file_path: str, profile_name: str, marker_dir: str = "") -> str:
-    """Format Phase 3 block message for implementation file edit attempt."""
-    mark_cmd = "true # wp:mark-complete tests"
-
-    return f"""## WP Phase 3: Test Writing ({profile_name})
+PHASE_GUARD_PHASE3_TEMPLATE = """## WP Phase 3: Test Writing ({profile_name})
 
 **Blocked:** Cannot edit `{file_path}`
 
@@ -159,12 +145,27 @@ You are in **Phase 3 (Tests)**. Implementation files cannot be edited yet.
 3. Present tests to user for approval
 4. Mark tests complete:
    ```bash
-   {mark_cmd}
+   true # wp:mark-complete tests
    ```
 
 **After marking complete**, you'll advance to Phase 4 (Implementation)."""
 
 
+def format_phase_guard_phase1_block(file_path: str, profile_name: str, marker_dir: str = "") -> str:
+    """Format Phase 1 block message for source file edit attempt."""
+    return PHASE_GUARD_PHASE1_TEMPLATE.format(file_path=file_path, profile_name=profile_name)
+
+
+def format_phase_guard_phase2_block(file_path: str, profile_name: str, marker_dir: str = "") -> str:
+    """Format Phase 2 block message for test file edit attempt."""
+    return PHASE_GUARD_PHASE2_TEMPLATE.format(file_path=file_path, profile_name=profile_name)
+
+
+def format_phase_guard_phase3_block(file_path: str, profile_name: str, marker_dir: str = "") -> str:
+    """Format Phase 3 block message for implementation file edit attempt."""
+    return PHASE_GUARD_PHASE3_TEMPLATE.format(file_path=file_path, profile_name=profile_name)
+
+
 # =============================================================================
 # Orchestrator Formatters (Phase Blocks)
 # =============================================================================
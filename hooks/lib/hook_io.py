@@ -11,8 +11,27 @@ Usage:
 import json
 import sys
 from dataclasses import dataclass
+from json.encoder import encode_basestring_ascii
 from typing import Any, Dict
 
+# approve_with_message payload, laid out exactly as json.dumps(indent=2) would
+_APPROVE_TEMPLATE = """{{
+  "decision": "approve",
+  "reason": {reason},
+  "hookSpecificOutput": {{
+    "hookEventName": {hook_event},
+    "additionalContext": {context}
+  }}
+}}
+"""
+
+
+def _json_value(value: Any) -> str:
+    """Encode a JSON value; non-str input (e.g. None) falls back to json.dumps."""
+    if isinstance(value, str):
+        return encode_basestring_ascii(value)
+    return json.dumps(value)
+
 
 @dataclass
 class HookInput:
@@ -63,14 +82,10 @@ def approve_with_message(reason: str, hook_event: str, context: str) -> None:
         hook_event: The hook event name (e.g., "PostToolUse")
         context: Detailed context/message to show
     """
-    output = {
-        "decision": "approve",
-        "reason": reason,
-        "hookSpecificOutput": {
-            "hookEventName": hook_event,
-            "additionalContext": context
-        }
-    }
-    print(json.dumps(output, indent=2))
+    sys.stdout.write(_APPROVE_TEMPLATE.format(
+        reason=_json_value(reason),
+        hook_event=_json_value(hook_event),
+        context=_json_value(context),
+    ))
 
 
@@ -6,9 +6,20 @@ Thin wrapper around WPState for backward compatibility with hooks.
 Delegates all operations to WPState.
 """
 
+from dataclasses import dataclass
+from pathlib import Path
+
 from wp_state import WPState
 
 
+@dataclass(frozen=True)
+class MarkerSnapshot:
+    """Point-in-time view of the state fields hooks check on every call."""
+    wp_active: bool
+    phase: int
+    impl_complete: bool
+
+
 class MarkerManager:
     """
     Manages Waypoints state with session isolation.
@@ -36,6 +47,26 @@ class MarkerManager:
         """Check if running under supervisor control."""
         return self._state.is_supervisor_mode()
 
+    @staticmethod
+    def state_file_path(session_id: str) -> Path:
+        """Get the state file path for a session without touching the filesystem."""
+        return WPState.cli_state_file(session_id)
+
+    # --- Snapshot ---
+
+    def snapshot(self) -> MarkerSnapshot:
+        """
+        Read state once and return the fields hooks query back-to-back.
+
+        Avoids re-reading state.json for is_wp_active() followed by get_phase().
+        """
+        state = self._state.read_state()
+        return MarkerSnapshot(
+            wp_active=state.active,
+            phase=WPState.effective_phase(state.phase),
+            impl_complete=state.completedPhases.implementation,
+        )
+
     # --- Active State ---
 
     def is_wp_active(self) -> bool:
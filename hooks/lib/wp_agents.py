@@ -93,7 +93,7 @@ class AgentLoader:
         if not agent_files:
             return ""
 
-        agent_content = ""
+        parts = []
         for agent_file in agent_files:
             agent_name = self.get_agent_name(agent_file)
             if logger:
@@ -102,9 +102,9 @@ class AgentLoader:
 
             content = self.get_agent_content(agent_file)
             if content:
-                agent_content += f"\n\n---\n\n## Agent: {agent_name}\n\n{content}"
+                parts.append(f"\n\n---\n\n## Agent: {agent_name}\n\n{content}")
 
-        return agent_content
+        return "".join(parts)
 
     def list_agents(self) -> str:
         """List all agents with their phase bindings (JSON)."""
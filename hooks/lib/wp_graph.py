@@ -317,6 +317,21 @@ class GraphStorage:
         path = self._get_global_graph_path()
         return self._save_graph_to_file(path, graph)
 
+    def files_signature(self, project_id: str) -> Tuple[Optional[Tuple[int, int]], ...]:
+        """
+        (mtime_ns, size) of the project and global graph files, None where a
+        file can't be stat'ed. Equal signatures mean the graphs on disk are unchanged.
+        """
+        signature = []
+        for path in (self._get_project_graph_path(project_id), self._get_global_graph_path()):
+            try:
+                st = os.stat(path)
+            except OSError:
+                signature.append(None)
+            else:
+                signature.append((st.st_mtime_ns, st.st_size))
+        return tuple(signature)
+
     def _get_project_graph_path(self, project_id: str) -> Path:
         """Get path to project graph file."""
         return self._knowledge_base_dir / project_id / "graph.json"
@@ -397,6 +412,12 @@ class GraphStorage:
         return KnowledgeGraph()
 
 
+# Relationship marker: [relationship_type: "target title"] (case-sensitive,
+# double-quoted target title)
+_RELATIONSHIP_RE = re.compile(r'\[(\w+):\s*"([^"]+)"\]')
+_WHITESPACE_RE = re.compile(r'\s+')
+
+
 class RelationshipParser:
     """
     Parses relationship markers from Claude's extraction output [REQ-3, REQ-17, REQ-18].
@@ -419,13 +440,10 @@ class RelationshipParser:
         Note:
             On malformed syntax [EDGE-3]: Logs warning, skips invalid markers
         """
-        # Pattern: [relationship_type: "target title"]
-        # Case-sensitive, double-quoted target title
-        pattern = r'\[(\w+):\s*"([^"]+)"\]'
         relationships = []
         logger = logging.getLogger(__name__)
 
-        for match in re.finditer(pattern, content):
+        for match in _RELATIONSHIP_RE.finditer(content):
             rel_type_str = match.group(1)
             target_title = match.group(2)
 
@@ -450,11 +468,9 @@ class RelationshipParser:
         Returns:
             Content with markers removed
         """
-        # Pattern: [relationship_type: "target title"]
-        pattern = r'\[(\w+):\s*"([^"]+)"\]'
         # Remove markers but keep surrounding text
-        result = re.sub(pattern, '', content)
+        result = _RELATIONSHIP_RE.sub('', content)
         # Clean up extra spaces
-        result = re.sub(r'\s+', ' ', result)
+        result = _WHITESPACE_RE.sub(' ', result)
         return result.strip()
 
@@ -27,6 +27,7 @@ from enum import Enum
 from pathlib import Path
 from typing import Optional, List, Dict, Any, Tuple
 from dataclasses import dataclass, asdict, field
+from functools import lru_cache
 
 # Lazy imports for graph and RAG (set at module level for test mocking)
 GraphStorage = None
@@ -60,7 +61,7 @@ class KnowledgeCategory(Enum):
         return self == KnowledgeCategory.LESSONS_LEARNED
 
 
-@dataclass
+@dataclass(slots=True)
 class StagedKnowledgeEntry:
     """
     A single knowledge entry staged for later application.
@@ -80,13 +81,14 @@ class StagedKnowledgeEntry:
     relationships: List[Tuple[str, str]] = field(default_factory=list)  # [(type, target_title)]
 
 
-@dataclass
+@dataclass(slots=True)
 class StagedKnowledge:
     """
     Container for all staged knowledge across categories.
 
-    Stored in workflow state directory as staged-knowledge.json.
-    Structure matches [REQ-14]:
+    Staged in the workflow state directory as staged-knowledge.jsonl,
+    one line per entry tagged with its category.
+    Loaded structure matches [REQ-14]:
     {
         "architecture": [...],
         "decisions": [...],
@@ -99,18 +101,14 @@ class StagedKnowledge:
 
     def is_empty(self) -> bool:
         """Check if there is any staged knowledge."""
-        return (
-            len(self.architecture) == 0
-            and len(self.decisions) == 0
-            and len(self.lessons_learned) == 0
-        )
+        return not (self.architecture or self.decisions or self.lessons_learned)
 
     def total_count(self) -> int:
         """Get total number of staged entries across all categories."""
         return len(self.architecture) + len(self.decisions) + len(self.lessons_learned)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ExtractionResult:
     """
     Result of parsing Claude's knowledge extraction response.
@@ -125,6 +123,11 @@ class ExtractionResult:
     parse_error: Optional[str] = None
 
 
+# Repository name from a git remote URL (SSH form, then HTTPS form)
+_SSH_REMOTE_RE = re.compile(r':([^/]+)/([^/]+?)(?:\.git)?$')
+_HTTPS_REMOTE_RE = re.compile(r'/([^/]+?)(?:\.git)?$')
+
+
 class ProjectIdentifier:
     """Identifies the current project for knowledge scoping."""
 
@@ -176,12 +179,12 @@ class ProjectIdentifier:
                 return None
 
             # Handle SSH URLs: git@github.com:user/repo.git
-            ssh_match = re.search(r':([^/]+)/([^/]+?)(?:\.git)?$', url)
+            ssh_match = _SSH_REMOTE_RE.search(url)
             if ssh_match:
                 return ssh_match.group(2)
 
             # Handle HTTPS URLs: https://github.com/user/repo.git
-            https_match = re.search(r'/([^/]+?)(?:\.git)?$', url)
+            https_match = _HTTPS_REMOTE_RE.search(url)
             if https_match:
                 return https_match.group(1)
 
@@ -194,6 +197,17 @@ class ProjectIdentifier:
         return Path(self.project_dir).name
 
 
+# A section header ("ARCHITECTURE:" etc.) at the start of a line and its body,
+# which runs up to the next header line or the end of the text. Header and
+# terminator accept the same trailing whitespace, so a "DECISIONS: " line
+# ends the previous section instead of being swallowed by it.
+_SECTION_RE = re.compile(
+    r'^(?P<kind>ARCHITECTURE|DECISIONS|LESSONS_LEARNED):[^\S\n]*\n'
+    r'(?P<body>.*?)(?=^(?:ARCHITECTURE|DECISIONS|LESSONS_LEARNED):[^\S\n]*$|\Z)',
+    re.DOTALL | re.MULTILINE
+)
+
+
 def extract_from_text(response_text: str) -> ExtractionResult:
     """
     Parse Claude's knowledge extraction response into structured data.
@@ -236,42 +250,15 @@ def extract_from_text(response_text: str) -> ExtractionResult:
             parse_error=None
         )
 
-    # Try to parse sections
-    architecture_entries: List[StagedKnowledgeEntry] = []
-    decisions_entries: List[StagedKnowledgeEntry] = []
-    lessons_entries: List[StagedKnowledgeEntry] = []
-
-    # Extract ARCHITECTURE section - stops at DECISIONS: or LESSONS_LEARNED: on new line
-    arch_match = re.search(
-        r'ARCHITECTURE:\s*\n(.*?)(?=^DECISIONS:$|^LESSONS_LEARNED:$|\Z)',
-        text,
-        re.DOTALL | re.MULTILINE
-    )
-    if arch_match:
-        architecture_entries = _parse_architecture_section(arch_match.group(1))
-
-    # Extract DECISIONS section
-    dec_match = re.search(
-        r'DECISIONS:\s*\n(.*?)(?=^ARCHITECTURE:$|^LESSONS_LEARNED:$|\Z)',
-        text,
-        re.DOTALL | re.MULTILINE
-    )
-    if dec_match:
-        decisions_entries = _parse_decisions_section(dec_match.group(1))
-
-    # Extract LESSONS_LEARNED section
-    lessons_match = re.search(
-        r'LESSONS_LEARNED:\s*\n(.*?)(?=^ARCHITECTURE:$|^DECISIONS:$|\Z)',
-        text,
-        re.DOTALL | re.MULTILINE
-    )
-    if lessons_match:
-        lessons_entries = _parse_lessons_learned_section(lessons_match.group(1))
+    # One pass over the sections; the first section of each kind wins
+    bodies: Dict[str, str] = {}
+    for match in _SECTION_RE.finditer(text):
+        bodies.setdefault(match.group('kind'), match.group('body'))
 
     knowledge = StagedKnowledge(
-        architecture=architecture_entries,
-        decisions=decisions_entries,
-        lessons_learned=lessons_entries
+        architecture=_parse_architecture_section(bodies.get('ARCHITECTURE', '')),
+        decisions=_parse_decisions_section(bodies.get('DECISIONS', '')),
+        lessons_learned=_parse_lessons_learned_section(bodies.get('LESSONS_LEARNED', ''))
     )
 
     # Determine if we had content
@@ -298,33 +285,10 @@ def _parse_architecture_section(section_text: str) -> List[StagedKnowledgeEntry]
     Returns:
         List of StagedKnowledgeEntry (without tag, phase set to 0 - caller sets phase)
     """
-    from wp_graph import RelationshipParser
-
-    entries = []
-    lines = section_text.strip().split('\n')
-
-    for line in lines:
-        line = line.strip()
-        if not line or not line.startswith('- '):
-            continue
-
-        # Parse: "- Title: Description"
-        match = re.match(r'^-\s+([^:]+):\s*(.+)$', line)
-        if match:
-            title = match.group(1).strip()
-            content = match.group(2).strip()
-
-            # Parse relationships from content
-            relationships = RelationshipParser.parse_relationships(content)
-
-            entries.append(StagedKnowledgeEntry(
-                title=title,
-                content=content,
-                phase=0,
-                relationships=[(rel_type.value, target) for rel_type, target in relationships]
-            ))
-
-    return entries
+    return [
+        StagedKnowledgeEntry(title=title, content=content, phase=0, relationships=list(relationships))
+        for _, title, content, relationships in _parse_entry_lines(section_text, tagged=False)
+    ]
 
 
 def _parse_decisions_section(section_text: str) -> List[StagedKnowledgeEntry]:
@@ -359,35 +323,62 @@ def _parse_lessons_learned_section(section_text: str) -> List[StagedKnowledgeEnt
     Returns:
         List of StagedKnowledgeEntry (with tag, phase set to 0 - caller sets phase)
     """
-    from wp_graph import RelationshipParser
+    return [
+        StagedKnowledgeEntry(title=title, content=content, phase=0, tag=tag, relationships=list(relationships))
+        for tag, title, content, relationships in _parse_entry_lines(section_text, tagged=True)
+    ]
+
+
+# Entry lines "- Title: Description" and "- [Tag] Title: Description",
+# matched across a whole section ([^\S\n] is whitespace other than newline)
+_ENTRY_RE = re.compile(
+    r'^[^\S\n]*- [^\S\n]*([^:\n]+):[^\S\n]*(\S.*)$',
+    re.MULTILINE
+)
+_TAGGED_ENTRY_RE = re.compile(
+    r'^[^\S\n]*- [^\S\n]*\[([^\]\n]+)\][^\S\n]+([^:\n]+):[^\S\n]*(\S.*)$',
+    re.MULTILINE
+)
+
+# (tag, title, content, relationships) for one parsed entry line
+_EntryRow = Tuple[Optional[str], str, str, Tuple[Tuple[str, str], ...]]
+
+
+@lru_cache(maxsize=256)
+def _parse_entry_lines(section_text: str, tagged: bool) -> Tuple[_EntryRow, ...]:
+    """
+    Parse the "- ..." lines of a section into immutable entry rows.
 
-    entries = []
-    lines = section_text.strip().split('\n')
+    Cached on the section text, since extraction and apply passes parse the
+    same response. Rows are tuples so the cache can't be mutated; callers
+    build fresh StagedKnowledgeEntry objects from them.
+    """
+    from wp_graph import RelationshipParser
 
-    for line in lines:
-        line = line.strip()
-        if not line or not line.startswith('- '):
-            continue
+    pattern = _TAGGED_ENTRY_RE if tagged else _ENTRY_RE
+    rows = []
+    for match in pattern.finditer(section_text):
+        if tagged:
+            tag, title, content = (g.strip() for g in match.groups())
+        else:
+            tag = None
+            title, content = (g.strip() for g in match.groups())
 
-        # Parse: "- [Tag] Title: Description"
-        match = re.match(r'^-\s+\[([^\]]+)\]\s+([^:]+):\s*(.+)$', line)
-        if match:
-            tag = match.group(1).strip()
-            title = match.group(2).strip()
-            content = match.group(3).strip()
+        # Parse relationships from content
+        relationships = tuple(
+            (rel_type.value, target)
+            for rel_type, target in RelationshipParser.parse_relationships(content)
+        )
+        rows.append((tag, title, content, relationships))
 
-            # Parse relationships from content
-            relationships = RelationshipParser.parse_relationships(content)
+    return tuple(rows)
 
-            entries.append(StagedKnowledgeEntry(
-                title=title,
-                content=content,
-                phase=0,
-                tag=tag,
-                relationships=[(rel_type.value, target) for rel_type, target in relationships]
-            ))
 
-    return entries
+# "## ..." / "### ..." headings in the legacy markdown files; lessons-learned
+# groups under "## [Tag]" and dates its titles as "### Title (YYYY-MM-DD)"
+_HEADING_RE = re.compile(r'^(##|###) (.+?)[ \t]*$', re.MULTILINE)
+_TAG_HEADING_RE = re.compile(r'\[(.+)\]')
+_DATED_TITLE_RE = re.compile(r'^(.+) \(\d{4}-\d{2}-\d{2}\)$')
 
 
 class KnowledgeManager:
@@ -429,8 +420,14 @@ class KnowledgeManager:
         """
         self.project_dir = project_dir
         self._project_identifier = ProjectIdentifier(project_dir)
-        claude_config = os.environ.get("CLAUDE_CONFIG_DIR", str(Path.home() / ".claude"))
+        self._project_id: Optional[str] = None
+        # Construction touches no files; Path.home() is only consulted
+        # when CLAUDE_CONFIG_DIR is unset
+        claude_config = os.environ.get("CLAUDE_CONFIG_DIR")
+        if claude_config is None:
+            claude_config = str(Path.home() / ".claude")
         self._knowledge_base_dir = Path(claude_config) / "waypoints" / "knowledge"
+        self._knowledge_file_paths: Dict[KnowledgeCategory, Path] = {}
         self._logger = logging.getLogger(__name__)
 
         # Graph and RAG components (lazy-loaded)
@@ -444,10 +441,18 @@ class KnowledgeManager:
         # Stats from last load_knowledge_context call (for external logging)
         self.load_stats = None
 
+        # Last legacy context as (file signatures, text); one entry only
+        self._legacy_context_cache: Optional[Tuple[tuple, str]] = None
+
+        # File signatures the loaded graphs were read at (None = reload)
+        self._graphs_signature: Optional[tuple] = None
+
     @property
     def project_id(self) -> str:
-        """Get the project ID (lazy evaluation)."""
-        return self._project_identifier.get_project_id()
+        """Get the project ID (resolved on first access, then reused)."""
+        if self._project_id is None:
+            self._project_id = self._project_identifier.get_project_id()
+        return self._project_id
 
     @property
     def graph_storage(self):
@@ -459,6 +464,8 @@ class KnowledgeManager:
     def graph_storage(self, value):
         """Set graph storage (for testing)."""
         self._graph_storage = value
+        # Graphs loaded from the previous storage must not be reused
+        self._graphs_signature = None
 
     @property
     def rag_service(self):
@@ -507,10 +514,19 @@ class KnowledgeManager:
             self._rag_service = RAGService(embeddings_model, embeddings_storage)
 
     def _load_graphs(self):
-        """Load project and global graphs from storage."""
+        """Load project and global graphs from storage, reusing them while both files are unchanged."""
         self._initialize_graph_storage()
+        signature = self._graph_storage.files_signature(self.project_id)
+        if (
+            signature == self._graphs_signature
+            and self._project_graph is not None
+            and self._global_graph is not None
+        ):
+            return
+
         self._project_graph = self._graph_storage.load_project_graph(self.project_id)
         self._global_graph = self._graph_storage.load_global_graph()
+        self._graphs_signature = signature
 
     # --- Knowledge Loading [REQ-1, REQ-2, REQ-3, REQ-4] ---
 
@@ -648,11 +664,19 @@ class KnowledgeManager:
         - Decisions
         - Lessons Learned
 
-        Files that don't exist show placeholder text [REQ-4].
+        Files that don't exist show placeholder text [REQ-4]. The result is
+        reused while none of the three files has changed (mtime and size).
 
         Returns:
             Formatted string for injection into Claude's context
         """
+        key = tuple(
+            self._file_signature(self._get_knowledge_file_path(category))
+            for category in KnowledgeCategory
+        )
+        if self._legacy_context_cache is not None and self._legacy_context_cache[0] == key:
+            return self._legacy_context_cache[1]
+
         sections = []
 
         # Load architecture [REQ-2]
@@ -677,7 +701,18 @@ class KnowledgeManager:
             sections.append("## Lessons Learned\n\nNo lessons learned documented yet.")
 
         # Format as Project Knowledge section [REQ-3]
-        return "# Project Knowledge\n\n" + "\n\n".join(sections)
+        context = "# Project Knowledge\n\n" + "\n\n".join(sections)
+        self._legacy_context_cache = (key, context)
+        return context
+
+    @staticmethod
+    def _file_signature(path: Path) -> Optional[Tuple[int, int]]:
+        """(mtime_ns, size) of a file, or None if it can't be stat'ed."""
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
 
     def _load_architecture(self) -> Optional[str]:
         """
@@ -686,13 +721,7 @@ class KnowledgeManager:
         Returns:
             File content if exists, None otherwise
         """
-        path = self._get_knowledge_file_path(KnowledgeCategory.ARCHITECTURE)
-        if path.exists():
-            try:
-                return path.read_text()
-            except IOError:
-                return None
-        return None
+        return self._read_knowledge_file(KnowledgeCategory.ARCHITECTURE)
 
     def _load_decisions(self) -> Optional[str]:
         """
@@ -701,13 +730,7 @@ class KnowledgeManager:
         Returns:
             File content if exists, None otherwise
         """
-        path = self._get_knowledge_file_path(KnowledgeCategory.DECISIONS)
-        if path.exists():
-            try:
-                return path.read_text()
-            except IOError:
-                return None
-        return None
+        return self._read_knowledge_file(KnowledgeCategory.DECISIONS)
 
     def _load_lessons_learned(self) -> Optional[str]:
         """
@@ -716,13 +739,17 @@ class KnowledgeManager:
         Returns:
             File content if exists, None otherwise
         """
-        path = self._get_knowledge_file_path(KnowledgeCategory.LESSONS_LEARNED)
-        if path.exists():
-            try:
-                return path.read_text()
-            except IOError:
-                return None
-        return None
+        return self._read_knowledge_file(KnowledgeCategory.LESSONS_LEARNED)
+
+    def _read_knowledge_file(self, category: KnowledgeCategory) -> Optional[str]:
+        """Read a category's knowledge file; None if it is missing or unreadable."""
+        # Open directly rather than stat first: a missing file costs one failed open().
+        # Binary read + one UTF-8 decode skips TextIOWrapper's newline translation.
+        try:
+            with open(self._get_knowledge_file_path(category), 'rb') as f:
+                return f.read().decode('utf-8')
+        except (OSError, UnicodeDecodeError):
+            return None
 
     # --- Knowledge Application [REQ-17, REQ-18, REQ-19, REQ-20, REQ-21] ---
 
@@ -754,15 +781,21 @@ class KnowledgeManager:
         if staged.is_empty():
             return {}
 
+        self._legacy_context_cache = None
+
+        # One date for the whole apply, shared by every entry and header
+        today = date.today().isoformat()
+
         if self._enable_graph:
-            return self._apply_to_graph(staged, session_id)
+            return self._apply_to_graph(staged, session_id, today)
         else:
-            return self._apply_to_markdown_legacy(staged, session_id)
+            return self._apply_to_markdown_legacy(staged, session_id, today)
 
     def _apply_to_graph(
         self,
         staged: StagedKnowledge,
-        session_id: str
+        session_id: str,
+        today: str
     ) -> Dict[str, int]:
         """
         Apply staged knowledge to graph structure [REQ-1, REQ-19].
@@ -770,13 +803,11 @@ class KnowledgeManager:
         Args:
             staged: StagedKnowledge container with all entries
             session_id: Session ID for node metadata
+            today: ISO date (YYYY-MM-DD) for node IDs and date_added
 
         Returns:
             Summary dict with counts
         """
-        from wp_graph import RelationshipType
-        from datetime import date
-
         self._load_graphs()
         counts: Dict[str, int] = {}
 
@@ -786,7 +817,8 @@ class KnowledgeManager:
                 staged.architecture,
                 KnowledgeCategory.ARCHITECTURE,
                 session_id,
-                self._project_graph
+                self._project_graph,
+                today
             )
             if arch_count > 0:
                 counts["architecture"] = arch_count
@@ -797,7 +829,8 @@ class KnowledgeManager:
                 staged.decisions,
                 KnowledgeCategory.DECISIONS,
                 session_id,
-                self._project_graph
+                self._project_graph,
+                today
             )
             if dec_count > 0:
                 counts["decisions"] = dec_count
@@ -809,7 +842,8 @@ class KnowledgeManager:
                 staged.lessons_learned,
                 KnowledgeCategory.LESSONS_LEARNED,
                 session_id,
-                self._global_graph
+                self._global_graph,
+                today
             )
             if lessons_count > 0:
                 counts["lessons-learned"] = lessons_count
@@ -819,6 +853,8 @@ class KnowledgeManager:
             self._logger.warning("Failed to save project graph")
         if not self._graph_storage.save_global_graph(self._global_graph):
             self._logger.warning("Failed to save global graph")
+        # The in-memory graphs now hold this apply; reload from disk next time
+        self._graphs_signature = None
 
         # Regenerate markdown views [REQ-15]
         self.regenerate_all_markdown_views()
@@ -856,11 +892,11 @@ class KnowledgeManager:
         entries: List[StagedKnowledgeEntry],
         category: KnowledgeCategory,
         session_id: str,
-        graph
+        graph,
+        today: str
     ) -> int:
-        """Add entries to graph with relationship parsing."""
+        """Add entries to graph with relationship parsing; today is the ISO date for every node."""
         from wp_graph import KnowledgeNode, NodeId, RelationshipType, RelationshipParser
-        from datetime import date
 
         for entry in entries:
             # Strip relationship markers from content
@@ -870,7 +906,7 @@ class KnowledgeManager:
             node_id = NodeId(
                 category=category.value,
                 title=entry.title,
-                date=date.today().isoformat()
+                date=today
             )
 
             # Create knowledge node
@@ -879,7 +915,7 @@ class KnowledgeManager:
                 title=entry.title,
                 content=clean_content,
                 category=category.value,
-                date_added=date.today().isoformat(),
+                date_added=today,
                 session_id=session_id,
                 tag=entry.tag
             )
@@ -908,7 +944,8 @@ class KnowledgeManager:
     def _apply_to_markdown_legacy(
         self,
         staged: StagedKnowledge,
-        session_id: str
+        session_id: str,
+        today: str
     ) -> Dict[str, int]:
         """
         Apply staged knowledge to markdown files (LEGACY MODE).
@@ -916,6 +953,7 @@ class KnowledgeManager:
         Args:
             staged: StagedKnowledge container with all entries
             session_id: Session ID for date headers
+            today: ISO date (YYYY-MM-DD) for date headers
 
         Returns:
             Summary dict: {"architecture": 2, "decisions": 1, "lessons-learned": 3}
@@ -924,19 +962,19 @@ class KnowledgeManager:
 
         # Apply architecture entries
         if staged.architecture:
-            arch_count = self._apply_architecture_entries(staged.architecture, session_id)
+            arch_count = self._apply_architecture_entries(staged.architecture, session_id, today)
             if arch_count > 0:
                 counts["architecture"] = arch_count
 
         # Apply decisions entries
         if staged.decisions:
-            dec_count = self._apply_decisions_entries(staged.decisions, session_id)
+            dec_count = self._apply_decisions_entries(staged.decisions, session_id, today)
             if dec_count > 0:
                 counts["decisions"] = dec_count
 
         # Apply lessons-learned entries
         if staged.lessons_learned:
-            lessons_count = self._apply_lessons_learned_entries(staged.lessons_learned)
+            lessons_count = self._apply_lessons_learned_entries(staged.lessons_learned, today)
             if lessons_count > 0:
                 counts["lessons-learned"] = lessons_count
 
@@ -945,7 +983,8 @@ class KnowledgeManager:
     def _apply_architecture_entries(
         self,
         entries: List[StagedKnowledgeEntry],
-        session_id: str
+        session_id: str,
+        today: str
     ) -> int:
         """
         Apply architecture entries to architecture.md.
@@ -964,15 +1003,20 @@ class KnowledgeManager:
         Args:
             entries: Architecture entries to apply
             session_id: Session ID for header
+            today: ISO date (YYYY-MM-DD) for header
 
         Returns:
-            Number of entries successfully applied
+            Number of entries successfully applied; entries whose title and
+            content are already in the file are skipped
         """
         if not entries:
             return 0
 
+        entries = self._new_entries(entries, KnowledgeCategory.ARCHITECTURE)
+        if not entries:
+            return 0
+
         path = self._get_knowledge_file_path(KnowledgeCategory.ARCHITECTURE)
-        today = date.today().strftime("%Y-%m-%d")
 
         # Build content with date header
         lines = [f"\n## {today} (Session: {session_id})\n"]
@@ -990,7 +1034,8 @@ class KnowledgeManager:
     def _apply_decisions_entries(
         self,
         entries: List[StagedKnowledgeEntry],
-        session_id: str
+        session_id: str,
+        today: str
     ) -> int:
         """
         Apply decisions entries to decisions.md.
@@ -1009,15 +1054,20 @@ class KnowledgeManager:
         Args:
             entries: Decisions entries to apply
             session_id: Session ID for header
+            today: ISO date (YYYY-MM-DD) for header
 
         Returns:
-            Number of entries successfully applied
+            Number of entries successfully applied; entries whose title and
+            content are already in the file are skipped
         """
         if not entries:
             return 0
 
+        entries = self._new_entries(entries, KnowledgeCategory.DECISIONS)
+        if not entries:
+            return 0
+
         path = self._get_knowledge_file_path(KnowledgeCategory.DECISIONS)
-        today = date.today().strftime("%Y-%m-%d")
 
         # Build content with date header
         lines = [f"\n## {today} (Session: {session_id})\n"]
@@ -1034,7 +1084,8 @@ class KnowledgeManager:
 
     def _apply_lessons_learned_entries(
         self,
-        entries: List[StagedKnowledgeEntry]
+        entries: List[StagedKnowledgeEntry],
+        today: str
     ) -> int:
         """
         Apply lessons-learned entries to global lessons-learned.md.
@@ -1054,23 +1105,25 @@ class KnowledgeManager:
 
         Args:
             entries: Lessons-learned entries to apply (must have tag set)
+            today: ISO date (YYYY-MM-DD) shown after each title
 
         Returns:
-            Number of entries successfully applied
+            Number of entries successfully applied; entries whose title and
+            content are already in the file are skipped
         """
         if not entries:
             return 0
 
+        entries = self._new_entries(entries, KnowledgeCategory.LESSONS_LEARNED)
+        if not entries:
+            return 0
+
         path = self._get_knowledge_file_path(KnowledgeCategory.LESSONS_LEARNED)
-        today = date.today().strftime("%Y-%m-%d")
 
         # Group entries by tag [REQ-21]
         entries_by_tag: Dict[str, List[StagedKnowledgeEntry]] = {}
         for entry in entries:
-            tag = entry.tag or "General"
-            if tag not in entries_by_tag:
-                entries_by_tag[tag] = []
-            entries_by_tag[tag].append(entry)
+            entries_by_tag.setdefault(entry.tag or "General", []).append(entry)
 
         # Build content grouped by tag
         lines = ["\n"]
@@ -1087,6 +1140,62 @@ class KnowledgeManager:
             return len(entries)
         return 0
 
+    def _existing_entry_keys(self, category: KnowledgeCategory) -> set:
+        """
+        Collect the keys of entries already written to a category's file.
+
+        Keys are (title, content), or (tag, title, content) for lessons-learned
+        where the same title may appear under different tags.
+        """
+        text = self._read_knowledge_file(category)
+        keys = set()
+        if not text:
+            return keys
+
+        tag = "General"
+        headings = list(_HEADING_RE.finditer(text))
+        for i, match in enumerate(headings):
+            level, heading = match.groups()
+            if level == '##':
+                tag_match = _TAG_HEADING_RE.fullmatch(heading)
+                if tag_match:
+                    tag = tag_match.group(1)
+                continue
+            end = headings[i + 1].start() if i + 1 < len(headings) else len(text)
+            content = text[match.end():end].strip()
+            if category.is_global:
+                dated = _DATED_TITLE_RE.match(heading)
+                keys.add((tag, dated.group(1) if dated else heading, content))
+            else:
+                keys.add((heading, content))
+        return keys
+
+    def _new_entries(
+        self,
+        entries: List[StagedKnowledgeEntry],
+        category: KnowledgeCategory
+    ) -> List[StagedKnowledgeEntry]:
+        """
+        Drop entries already in the category's file or repeated within entries.
+
+        An entry is a repeat only if both title and content match, so an
+        updated entry that reuses a title is still written.
+        """
+        seen = self._existing_entry_keys(category)
+        new_entries = []
+        for entry in entries:
+            content = entry.content.strip()
+            if category.is_global:
+                key = (entry.tag or "General", entry.title, content)
+            else:
+                key = (entry.title, content)
+            if key in seen:
+                self._logger.info(f"Skipping {category.value} entry already written: {entry.title}")
+                continue
+            seen.add(key)
+            new_entries.append(entry)
+        return new_entries
+
     def _append_to_file(self, path: Path, content: str, header: str = "") -> bool:
         """
         Append content to a file, creating it with header if needed.
@@ -1103,15 +1212,10 @@ class KnowledgeManager:
             # Create directories if needed [REQ-18]
             path.parent.mkdir(parents=True, exist_ok=True)
 
-            # If file doesn't exist, create with header
-            if not path.exists():
-                with open(path, 'w') as f:
-                    f.write(header)
-                    f.write(content)
-            else:
-                # Append to existing file [REQ-19]
-                with open(path, 'a') as f:
-                    f.write(content)
+            # One open in append mode; a new (empty) file gets the header
+            # first, otherwise content is appended [REQ-19]
+            with open(path, 'a', encoding='utf-8') as f:
+                f.write(header + content if f.tell() == 0 else content)
 
             return True
         except IOError as e:
@@ -1129,14 +1233,18 @@ class KnowledgeManager:
             category: Knowledge category
 
         Returns:
-            Path to the knowledge file
+            Path to the knowledge file (built once per category, then reused)
         """
-        if category.is_global:
-            # Global files go in the base knowledge directory [DEC-6]
-            return self._knowledge_base_dir / category.filename
-        else:
-            # Per-project files go in project-specific subdirectory
-            return self._knowledge_base_dir / self.project_id / category.filename
+        path = self._knowledge_file_paths.get(category)
+        if path is None:
+            if category.is_global:
+                # Global files go in the base knowledge directory [DEC-6]
+                path = self._knowledge_base_dir / category.filename
+            else:
+                # Per-project files go in project-specific subdirectory
+                path = self._knowledge_base_dir / self.project_id / category.filename
+            self._knowledge_file_paths[category] = path
+        return path
 
     # --- Graph Application and Markdown Generation [NEW] ---
 
@@ -1212,18 +1320,18 @@ class KnowledgeManager:
             arch_path = self._get_knowledge_file_path(KnowledgeCategory.ARCHITECTURE)
             arch_content = self.generate_markdown_from_graph(self._project_graph, KnowledgeCategory.ARCHITECTURE)
             arch_path.parent.mkdir(parents=True, exist_ok=True)
-            arch_path.write_text(arch_content)
+            arch_path.write_text(arch_content, encoding='utf-8')
 
             dec_path = self._get_knowledge_file_path(KnowledgeCategory.DECISIONS)
             dec_content = self.generate_markdown_from_graph(self._project_graph, KnowledgeCategory.DECISIONS)
             dec_path.parent.mkdir(parents=True, exist_ok=True)
-            dec_path.write_text(dec_content)
+            dec_path.write_text(dec_content, encoding='utf-8')
 
             # Regenerate global lessons-learned
             lessons_path = self._get_knowledge_file_path(KnowledgeCategory.LESSONS_LEARNED)
             lessons_content = self.generate_markdown_from_graph(self._global_graph, KnowledgeCategory.LESSONS_LEARNED)
             lessons_path.parent.mkdir(parents=True, exist_ok=True)
-            lessons_path.write_text(lessons_content)
+            lessons_path.write_text(lessons_content, encoding='utf-8')
 
             return True
         except Exception as e:
@@ -126,8 +126,7 @@ class WPState:
             workflow_id: Workflow identifier (for supervisor mode, auto-generated if not provided)
             mode: Operating mode - "cli" or "supervisor"
         """
-        claude_config = os.environ.get("CLAUDE_CONFIG_DIR", str(Path.home() / ".claude"))
-        self.base_dir = Path(claude_config) / "tmp"
+        self.base_dir = self._get_base_dir()
         self.session_id = session_id
         self.mode = mode
 
@@ -155,6 +154,28 @@ class WPState:
         self.state_dir.mkdir(parents=True, exist_ok=True)
         self._state_file = self.state_dir / self.STATE_FILE
 
+    @staticmethod
+    def _get_base_dir() -> Path:
+        """Get the base directory holding all Waypoints state directories."""
+        # Path.home() is only consulted when CLAUDE_CONFIG_DIR is unset
+        claude_config = os.environ.get("CLAUDE_CONFIG_DIR")
+        if claude_config is None:
+            claude_config = str(Path.home() / ".claude")
+        return Path(claude_config) / "tmp"
+
+    @classmethod
+    def cli_state_file(cls, session_id: str) -> Path:
+        """
+        Get the state file path a CLI-mode WPState would use for session_id.
+
+        Computed without creating the state directory, so callers can
+        cheaply check whether a workflow exists before doing any other work.
+        """
+        supervisor_markers_dir = os.environ.get("WP_SUPERVISOR_MARKERS_DIR")
+        if supervisor_markers_dir:
+            return Path(supervisor_markers_dir) / cls.STATE_FILE
+        return cls._get_base_dir() / f"wp-{session_id}" / cls.STATE_FILE
+
     def _generate_workflow_id(self) -> str:
         """Generate a unique workflow ID from timestamp."""
         return datetime.now().strftime("%Y%m%d-%H%M%S")
@@ -194,6 +215,15 @@ class WPState:
             # Corrupted state, return defaults
             return StateData()
 
+    def read_state(self) -> StateData:
+        """
+        Read the state file once, for callers that check several fields together.
+
+        Returns defaults if the file is missing or corrupted. The result is a
+        copy; changes to it are not saved.
+        """
+        return self._load_state()
+
     def _save_state(self, state: StateData) -> None:
         """Save state to file atomically."""
         # Convert dataclasses to dict
@@ -267,14 +297,17 @@ class WPState:
 
     # --- Phase Management ---
 
-    def get_phase(self) -> int:
-        """Get current Waypoints phase (1-4)."""
-        state = self._load_state()
-        phase = state.phase
+    @staticmethod
+    def effective_phase(phase: int) -> int:
+        """Phase as reported to callers: a stored value outside 1-4 reads as 1."""
         if phase < 1 or phase > 4:
             return 1
         return phase
 
+    def get_phase(self) -> int:
+        """Get current Waypoints phase (1-4)."""
+        return self.effective_phase(self._load_state().phase)
+
     def set_phase(self, phase: int) -> None:
         """Set the current Waypoints phase."""
         if phase < 1:
@@ -50,11 +50,11 @@ def main():
         return
 
     # Change to project directory
-    if not hook.cwd or not os.path.isdir(hook.cwd):
+    try:
+        os.chdir(hook.cwd)
+    except (OSError, TypeError):
         return
 
-    os.chdir(hook.cwd)
-
     # Initialize config
     config = WPConfig(hook.cwd)
 
@@ -64,10 +64,9 @@ def main():
         return
 
     # Skip if Waypoints Phase 4 is active (wp-auto-test handles compile+test)
-    if markers.is_wp_active():
-        wp_phase = markers.get_phase()
-        if wp_phase == 4:
-            return
+    snap = markers.snapshot()
+    if snap.wp_active and snap.phase == 4:
+        return
 
     # Get profile info and compile command
     profile_name = config.get_profile_name()
@@ -86,11 +85,12 @@ def main():
         result = subprocess.run(
             compile_cmd,
             shell=True,
-            capture_output=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
             text=True,
             timeout=120
         )
-        compile_output = result.stdout + result.stderr
+        compile_output = result.stdout
         compile_exit_code = result.returncode
     except subprocess.TimeoutExpired:
         compile_output = "Compilation timed out after 120 seconds"
@@ -39,11 +39,12 @@ def run_command(cmd: str, timeout: int = 300) -> tuple:
         result = subprocess.run(
             cmd,
             shell=True,
-            capture_output=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
             text=True,
             timeout=timeout
         )
-        return result.returncode, result.stdout + result.stderr
+        return result.returncode, result.stdout
     except subprocess.TimeoutExpired:
         return 1, f"Command timed out after {timeout} seconds"
     except Exception as e:
@@ -66,21 +67,24 @@ def main():
     if hook.tool_name not in ("Write", "Edit"):
         return
 
+    # Read state once for both the active check and the phase
+    snap = markers.snapshot()
+
     # Check if Waypoints mode is active
-    if not markers.is_wp_active():
+    if not snap.wp_active:
         return
 
     # Check if we're in Phase 4
-    current_phase = markers.get_phase()
+    current_phase = snap.phase
     if current_phase != 4:
         return
 
     # Change to project directory
-    if not hook.cwd or not os.path.isdir(hook.cwd):
+    try:
+        os.chdir(hook.cwd)
+    except (OSError, TypeError):
         return
 
-    os.chdir(hook.cwd)
-
     # Initialize config
     config = WPConfig(hook.cwd)
     profile_name = config.get_profile_name()
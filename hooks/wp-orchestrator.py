@@ -39,43 +39,57 @@ def run_command(cmd: str, timeout: int = 120) -> tuple:
         result = subprocess.run(
             cmd,
             shell=True,
-            capture_output=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
             text=True,
             timeout=timeout
         )
-        return result.returncode, result.stdout + result.stderr
+        return result.returncode, result.stdout
     except subprocess.TimeoutExpired:
         return 1, f"Command timed out after {timeout} seconds"
     except Exception as e:
         return 1, f"Command error: {e}"
 
 
-def format_compile_error(output: str, profile: str, cmd: str) -> str:
-    """Format a compile error message."""
-    return f"""## Compilation FAILED ({profile})
+COMPILE_ERROR_TEMPLATE = """## Compilation FAILED ({profile})
 
 **Command:** `{cmd}`
 
 **Output:**
 ```
-{output[:2000]}
+{output}
 ```
 
 Fix the compilation errors and try again."""
 
 
-def format_test_failure(output: str, profile: str) -> str:
-    """Format a test failure message."""
-    return f"""## Tests FAILED ({profile})
+TEST_FAILURE_TEMPLATE = """## Tests FAILED ({profile})
 
 **Output:**
 ```
-{output[:2000]}
+{output}
 ```
 
 Fix the failing tests and try again."""
 
 
+def format_compile_error(output: str, profile: str, cmd: str) -> str:
+    """Format a compile error message."""
+    return COMPILE_ERROR_TEMPLATE.format(
+        profile=profile,
+        cmd=cmd,
+        output=output[:2000]
+    )
+
+
+def format_test_failure(output: str, profile: str) -> str:
+    """Format a test failure message."""
+    return TEST_FAILURE_TEMPLATE.format(
+        profile=profile,
+        output=output[:2000]
+    )
+
+
 def main():
     # Skip when running under supervisor control (SDK handles hooks)
     if os.environ.get("WP_SUPERVISOR_ACTIVE") == "1":
@@ -92,23 +106,26 @@ def main():
     if hook.stop_hook_active:
         return
 
+    # Read state once for both the active check and the phase
+    snap = markers.snapshot()
+
     # Check if Waypoints mode is active
-    if not markers.is_wp_active():
+    if not snap.wp_active:
         return
 
     # Get current phase
-    current_phase = markers.get_phase()
+    current_phase = snap.phase
 
     # Phase 1: No build verification needed
     if current_phase == 1:
         return
 
     # Change to project directory for running commands
-    if not hook.cwd or not os.path.isdir(hook.cwd):
+    try:
+        os.chdir(hook.cwd)
+    except (OSError, TypeError):
         return
 
-    os.chdir(hook.cwd)
-
     # Initialize config
     config = WPConfig(hook.cwd)
     profile_name = config.get_profile_name()
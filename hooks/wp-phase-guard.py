@@ -14,13 +14,6 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'lib'))
 
 from hook_io import HookInput
 from markers import MarkerManager
-from wp_logging import WPLogger
-from wp_config import WPConfig
-from formatters import (
-    format_phase_guard_phase1_block,
-    format_phase_guard_phase2_block,
-    format_phase_guard_phase3_block,
-)
 
 
 def block_response(reason: str, context: str) -> None:
@@ -44,14 +37,6 @@ def main():
     # Parse hook input
     hook = HookInput.from_stdin()
 
-    # Initialize components
-    markers = MarkerManager(hook.session_id)
-    logger = WPLogger(hook.session_id)
-
-    # Check if Waypoints mode is active
-    if not markers.is_wp_active():
-        return
-
     # Only guard Write and Edit tools
     if hook.tool_name not in ("Write", "Edit"):
         return
@@ -60,8 +45,33 @@ def main():
     if not hook.file_path:
         return
 
+    # Fast path: this hook fires on every edit in every session, but most
+    # sessions never start Waypoints. Skip all remaining work (including
+    # the imports below) unless a state file exists.
+    if not MarkerManager.state_file_path(hook.session_id).exists():
+        return
+
+    from wp_logging import WPLogger
+    from wp_config import WPConfig
+    from formatters import (
+        format_phase_guard_phase1_block,
+        format_phase_guard_phase2_block,
+        format_phase_guard_phase3_block,
+    )
+
+    # Initialize components
+    markers = MarkerManager(hook.session_id)
+    logger = WPLogger(hook.session_id)
+
+    # Read state once for both the active check and the phase
+    snap = markers.snapshot()
+
+    # Check if Waypoints mode is active
+    if not snap.wp_active:
+        return
+
     # Get current phase
-    current_phase = markers.get_phase()
+    current_phase = snap.phase
 
     # Initialize config for pattern matching
     config = WPConfig(hook.cwd)
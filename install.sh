@@ -153,6 +153,8 @@ cp -r "$SOURCE_DIR/hooks" "$INSTALL_DIR/"
 chmod +x "$INSTALL_DIR/hooks/"*.sh 2>/dev/null || true
 chmod +x "$INSTALL_DIR/hooks/"*.py
 chmod +x "$INSTALL_DIR/hooks/lib/"*.sh 2>/dev/null || true
+# Precompile shared hook modules so hook invocations load cached bytecode
+python3 -m compileall -q "$INSTALL_DIR/hooks/lib" >/dev/null 2>&1 || true
 
 # Copy config
 echo "Installing configuration..."
@@ -110,6 +110,11 @@ if [[ "$RUN_PYTHON" == "true" ]]; then
             PYTEST_OPTS="-v --tb=long"
         fi
 
+        # Run in parallel when pytest-xdist is installed
+        if python3 -c "import xdist" &> /dev/null; then
+            PYTEST_OPTS="$PYTEST_OPTS -n auto"
+        fi
+
         # Apply filter if specified
         PYTEST_FILTER=""
         if [[ -n "$FILTER" ]]; then
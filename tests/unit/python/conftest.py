@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""
+Shared pytest setup for Python unit tests.
+
+Puts hooks/lib (bare-name hook modules) and the project root (wp_supervisor)
+on sys.path once per session, as absolute paths so tests don't depend on cwd.
+
+Set WP_TEST_TMPDIR (e.g. to /dev/shm) to put tmp_path directories (HOME,
+marker dirs, mock projects) under that directory instead of the system temp dir.
+"""
+
+import getpass
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent.parent
+
+for _path in (PROJECT_ROOT, PROJECT_ROOT / "hooks" / "lib"):
+    if str(_path) not in sys.path:
+        sys.path.insert(0, str(_path))
+
+
+def pytest_configure(config):
+    """
+    Use <WP_TEST_TMPDIR>/pytest-wp-<user> as --basetemp when set and --basetemp is not given.
+
+    The path is fixed per user, so pytest clears the previous run's tree at startup
+    instead of leaving one directory behind per run.
+    """
+    temp_root = os.environ.get("WP_TEST_TMPDIR")
+    if config.option.basetemp is None and temp_root and os.access(temp_root, os.W_OK):
+        try:
+            user = getpass.getuser()
+        except (ImportError, KeyError, OSError):
+            user = "unknown"
+        config.option.basetemp = os.path.join(temp_root, f"pytest-wp-{user}")
+
+
+@pytest.fixture(scope="session")
+def approve_fn():
+    """hook_io.approve_with_message, imported once per session."""
+    from hook_io import approve_with_message
+    return approve_with_message
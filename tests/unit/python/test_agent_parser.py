@@ -6,13 +6,10 @@ Unit tests for agent_parser.py
 import json
 import logging
 import os
-import sys
 import tempfile
 import pytest
 from pathlib import Path
 
-# Add hooks/lib to path
-sys.path.insert(0, 'hooks/lib')
 from agent_parser import (
     parse_frontmatter,
     get_content_without_frontmatter,
@@ -51,7 +51,6 @@ mock_sdk.types = mock_types
 sys.modules['claude_agent_sdk'] = mock_sdk
 sys.modules['claude_agent_sdk.types'] = mock_types
 
-sys.path.insert(0, '.')
 from wp_supervisor.hooks import SupervisorHooks
 from wp_supervisor.session import SessionRunner
 
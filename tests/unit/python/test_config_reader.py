@@ -3,93 +3,197 @@
 Unit tests for config_reader.py
 """
 
+import io
 import json
-import sys
-import tempfile
 import pytest
+from unittest.mock import patch
 
-# Add hooks/lib to path
-sys.path.insert(0, 'hooks/lib')
+import config_reader
 from config_reader import get_config_value
 
 
-class TestGetConfigValue:
-    """Tests for get_config_value function."""
+@pytest.fixture(scope="session")
+def config_dir(tmp_path_factory):
+    """Directory with JSON config files, written once per session."""
+    path = tmp_path_factory.mktemp("cfg")
+    (path / "simple.json").write_text(json.dumps({"name": "test"}))
+    (path / "invalid.json").write_text("invalid json {")
+    return path
+
+
+NESTED = json.dumps({"profiles": {"kotlin": {"name": "Kotlin", "version": "1.9"}}}).encode()
+DEEP = json.dumps({
+    "profiles": {
+        "typescript-npm": {
+            "commands": {
+                "compile": "npm run build"
+            }
+        }
+    }
+}).encode()
+
+
+class TestParse:
+    """Tests for parsing raw config bytes into a lookup index (no filesystem)."""
 
     def test_reads_simple_value(self):
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            json.dump({"name": "test"}, f)
-            f.flush()
-            result = get_config_value("name", f.name)
-            assert result == "test"
+        assert config_reader._parse(b'{"name": "test"}').get("name") == "test"
 
     def test_reads_nested_value(self):
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            json.dump({"profiles": {"kotlin": {"name": "Kotlin"}}}, f)
-            f.flush()
-            result = get_config_value("profiles.kotlin.name", f.name)
-            assert result == "Kotlin"
+        assert config_reader._parse(NESTED).get("profiles.kotlin.name") == "Kotlin"
 
     def test_reads_deeply_nested_value(self):
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            json.dump({
-                "profiles": {
-                    "typescript-npm": {
-                        "commands": {
-                            "compile": "npm run build"
-                        }
-                    }
-                }
-            }, f)
-            f.flush()
-            result = get_config_value("profiles.typescript-npm.commands.compile", f.name)
-            assert result == "npm run build"
+        index = config_reader._parse(DEEP)
+        assert index.get("profiles.typescript-npm.commands.compile") == "npm run build"
 
     def test_returns_dict_for_object_path(self):
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            json.dump({"profiles": {"kotlin": {"name": "Kotlin", "version": "1.9"}}}, f)
-            f.flush()
-            result = get_config_value("profiles.kotlin", f.name)
-            assert result == {"name": "Kotlin", "version": "1.9"}
+        index = config_reader._parse(NESTED)
+        assert index.get("profiles.kotlin") == {"name": "Kotlin", "version": "1.9"}
 
     def test_returns_list_for_array_path(self):
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            json.dump({"patterns": ["*.py", "*.ts"]}, f)
-            f.flush()
-            result = get_config_value("patterns", f.name)
-            assert result == ["*.py", "*.ts"]
+        index = config_reader._parse(b'{"patterns": ["*.py", "*.ts"]}')
+        assert index.get("patterns") == ["*.py", "*.ts"]
 
     def test_returns_none_for_missing_path(self):
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            json.dump({"name": "test"}, f)
-            f.flush()
-            result = get_config_value("nonexistent.path", f.name)
-            assert result is None
+        assert config_reader._parse(b'{"name": "test"}').get("nonexistent.path") is None
 
     def test_returns_none_for_partial_path(self):
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            json.dump({"profiles": {"kotlin": {"name": "Kotlin"}}}, f)
-            f.flush()
-            result = get_config_value("profiles.kotlin.commands.compile", f.name)
-            assert result is None
+        assert config_reader._parse(NESTED).get("profiles.kotlin.commands.compile") is None
+
+    def test_returns_none_when_traversing_non_dict(self):
+        assert config_reader._parse(b'{"name": "test"}').get("name.subkey") is None
+
+    def test_raises_for_invalid_json(self):
+        with pytest.raises(ValueError):
+            config_reader._parse(b"invalid json {")
+
+    def test_stdlib_fallback_gives_same_index(self):
+        with patch('config_reader._loads', json.loads):
+            fallback = config_reader._parse(DEEP)
+        assert fallback == config_reader._parse(DEEP)
+
+    def test_stdlib_fallback_raises_for_invalid_json(self):
+        with patch('config_reader._loads', json.loads):
+            with pytest.raises(ValueError):
+                config_reader._parse(b"invalid json {")
+
+
+class TestGetConfigValue:
+    """Tests for get_config_value file handling."""
+
+    def test_reads_value_from_file(self, config_dir):
+        result = get_config_value("name", str(config_dir / "simple.json"))
+        assert result == "test"
+
+    def test_returns_none_for_missing_path(self, config_dir):
+        result = get_config_value("nonexistent.path", str(config_dir / "simple.json"))
+        assert result is None
 
     def test_returns_none_for_missing_file(self):
         result = get_config_value("name", "/nonexistent/file.json")
         assert result is None
 
-    def test_returns_none_for_invalid_json(self):
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            f.write("invalid json {")
-            f.flush()
-            result = get_config_value("name", f.name)
-            assert result is None
+    def test_returns_none_for_invalid_json(self, config_dir):
+        result = get_config_value("name", str(config_dir / "invalid.json"))
+        assert result is None
 
-    def test_returns_none_when_traversing_non_dict(self):
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            json.dump({"name": "test"}, f)
-            f.flush()
-            result = get_config_value("name.subkey", f.name)
-            assert result is None
+    def test_returns_none_for_unreadable_file(self, tmp_path):
+        config_file = tmp_path / "unreadable.json"
+        config_file.write_text(json.dumps({"name": "test"}))
+
+        with patch("builtins.open", side_effect=PermissionError("denied")):
+            result = get_config_value("name", str(config_file))
+        assert result is None
+
+
+class TestGetConfigValueFromStream:
+    """Tests for get_config_value reading from a binary file-like object."""
+
+    def test_reads_simple_value(self):
+        assert get_config_value("name", io.BytesIO(b'{"name": "test"}')) == "test"
+
+    def test_reads_nested_value(self):
+        assert get_config_value("profiles.kotlin.name", io.BytesIO(NESTED)) == "Kotlin"
+
+    def test_returns_dict_for_object_path(self):
+        result = get_config_value("profiles.kotlin", io.BytesIO(NESTED))
+        assert result == {"name": "Kotlin", "version": "1.9"}
+
+    def test_returns_none_for_missing_path(self):
+        assert get_config_value("nonexistent.path", io.BytesIO(b'{"name": "test"}')) is None
+
+    def test_returns_none_for_invalid_json(self):
+        assert get_config_value("name", io.BytesIO(b"invalid json {")) is None
+
+    def test_does_not_populate_cache(self):
+        before = dict(config_reader._PARSED_CACHE)
+        get_config_value("name", io.BytesIO(b'{"name": "test"}'))
+        assert config_reader._PARSED_CACHE == before
+
+
+class TestParsedConfigCache:
+    """Tests for the parsed-config cache behind get_config_value."""
+
+    def test_repeated_lookups_parse_once(self, tmp_path):
+        config_file = tmp_path / "config.json"
+        config_file.write_text(json.dumps({"a": 1, "b": 2}))
+
+        with patch('config_reader._parse', wraps=config_reader._parse) as mock_parse:
+            assert get_config_value("a", str(config_file)) == 1
+            assert get_config_value("b", str(config_file)) == 2
+            assert mock_parse.call_count == 1
+
+    def test_rewritten_file_is_reparsed(self, tmp_path):
+        config_file = tmp_path / "config.json"
+        config_file.write_text(json.dumps({"name": "old"}))
+        assert get_config_value("name", str(config_file)) == "old"
+
+        config_file.write_text(json.dumps({"name": "newer"}))
+        assert get_config_value("name", str(config_file)) == "newer"
+
+    def test_invalid_json_is_not_cached(self, tmp_path):
+        config_file = tmp_path / "config.json"
+        config_file.write_text("invalid json {")
+        assert get_config_value("name", str(config_file)) is None
+        assert not any(key[0] == str(config_file) for key in config_reader._PARSED_CACHE)
+
+    def test_cache_is_bounded(self, tmp_path):
+        for i in range(config_reader._CACHE_MAX_ENTRIES + 5):
+            config_file = tmp_path / f"config{i}.json"
+            config_file.write_text(json.dumps({"i": i}))
+            assert get_config_value("i", str(config_file)) == i
+        assert len(config_reader._PARSED_CACHE) <= config_reader._CACHE_MAX_ENTRIES
+
+
+class TestFlatten:
+    """Tests for the dotted-key index built from parsed config."""
+
+    def test_indexes_leaves_and_subtrees(self):
+        index = config_reader._flatten({"a": {"b": {"c": 1}}, "d": [1, 2]})
+        assert index == {
+            "a": {"b": {"c": 1}},
+            "a.b": {"c": 1},
+            "a.b.c": 1,
+            "d": [1, 2],
+        }
+
+    def test_does_not_descend_into_lists(self):
+        index = config_reader._flatten({"d": [{"x": 1}]})
+        assert "d.x" not in index
+        assert "d.0" not in index
+
+    def test_skips_keys_containing_dots(self):
+        index = config_reader._flatten({"a.b": 1, "a": {"b": 2}})
+        assert index["a.b"] == 2
+
+    def test_empty_key_does_not_collide_with_root(self):
+        index = config_reader._flatten({"": {"x": 1}, "x": 2})
+        assert index["x"] == 2
+        assert index[".x"] == 1
+
+    def test_non_dict_root_gives_empty_index(self):
+        assert config_reader._flatten(["a", "b"]) == {}
+        assert config_reader._flatten("text") == {}
 
 
 if __name__ == '__main__':
@@ -13,12 +13,12 @@ Tests cover:
 - [ERR-2] Severity parsing failures should default to "medium"
 """
 
+import functools
+import inspect
 import os
-import sys
 import pytest
 from unittest.mock import MagicMock
 
-sys.path.insert(0, '.')
 from wp_supervisor.feedback_capping import (
     FeedbackCapper,
     Severity,
@@ -28,11 +28,20 @@ from wp_supervisor.feedback_capping import (
 )
 
 
-@pytest.fixture(autouse=True)
-def clean_supervisor_env(monkeypatch):
-    for key in list(os.environ):
-        if key.startswith("WP_SUPERVISOR_"):
-            monkeypatch.delenv(key, raising=False)
+@pytest.fixture(autouse=True, scope="module")
+def clean_supervisor_env():
+    # Module scope: nothing in this module sets WP_SUPERVISOR_* vars, so one
+    # snapshot/restore around the whole module is enough.
+    with pytest.MonkeyPatch.context() as mp:
+        for key in list(os.environ):
+            if key.startswith("WP_SUPERVISOR_"):
+                mp.delenv(key, raising=False)
+        yield
+
+
+# Members under test are the same objects in every test, so cache introspection
+_sig = functools.cache(inspect.signature)
+_isc = functools.cache(inspect.iscoroutinefunction)
 
 
 def create_mock_logger():
@@ -181,14 +190,12 @@ class TestFeedbackCapperInit:
 
     def test_init_requires_logger(self):
         """Init should require logger parameter."""
-        import inspect
-        params = inspect.signature(FeedbackCapper.__init__).parameters
+        params = _sig(FeedbackCapper.__init__).parameters
         assert 'logger' in params
 
     def test_init_accepts_optional_cap(self):
         """Init should accept optional cap parameter."""
-        import inspect
-        params = inspect.signature(FeedbackCapper.__init__).parameters
+        params = _sig(FeedbackCapper.__init__).parameters
         assert 'cap' in params
         assert params['cap'].default == DEFAULT_FEEDBACK_CAP
 
@@ -215,6 +222,22 @@ class TestFeedbackCapperInit:
         assert capper.cap == DEFAULT_FEEDBACK_CAP
 
 
+# =============================================================================
+# FeedbackCapper Interface Tests
+# =============================================================================
+
+@pytest.mark.parametrize("name", [
+    "parse_severity",
+    "categorize_findings",
+    "apply_cap",
+    "cap_and_format",
+])
+def test_feedback_capper_method_exists(name):
+    """FeedbackCapper public methods should exist and be synchronous."""
+    assert hasattr(FeedbackCapper, name)
+    assert not _isc(getattr(FeedbackCapper, name))
+
+
 # =============================================================================
 # FeedbackCapper.parse_severity Tests
 # =============================================================================
@@ -222,10 +245,6 @@ class TestFeedbackCapperInit:
 class TestFeedbackCapperParseSeverity:
     """Tests for FeedbackCapper.parse_severity method."""
 
-    def test_parse_severity_method_exists(self):
-        """parse_severity method should exist."""
-        assert hasattr(FeedbackCapper, 'parse_severity')
-
     def test_parse_severity_critical_lowercase(self):
         """[REQ-2.1] Should parse 'critical' to Severity.CRITICAL."""
         # given
@@ -333,10 +352,6 @@ class TestFeedbackCapperParseSeverity:
 class TestFeedbackCapperCategorizeFindings:
     """Tests for FeedbackCapper.categorize_findings method."""
 
-    def test_categorize_findings_method_exists(self):
-        """categorize_findings method should exist."""
-        assert hasattr(FeedbackCapper, 'categorize_findings')
-
     def test_categorize_findings_returns_list(self):
         """Should return list of CategorizedFinding objects."""
         # given
@@ -438,10 +453,6 @@ class TestFeedbackCapperCategorizeFindings:
 class TestFeedbackCapperApplyCap:
     """Tests for FeedbackCapper.apply_cap method."""
 
-    def test_apply_cap_method_exists(self):
-        """apply_cap method should exist."""
-        assert hasattr(FeedbackCapper, 'apply_cap')
-
     def test_apply_cap_returns_capping_result(self):
         """Should return CappingResult."""
         # given
@@ -609,10 +620,6 @@ class TestFeedbackCapperApplyCap:
 class TestFeedbackCapperCapAndFormat:
     """Tests for FeedbackCapper.cap_and_format convenience method."""
 
-    def test_cap_and_format_method_exists(self):
-        """cap_and_format method should exist."""
-        assert hasattr(FeedbackCapper, 'cap_and_format')
-
     def test_cap_and_format_returns_tuple(self):
         """Should return tuple of (capped issues, dropped count)."""
         # given
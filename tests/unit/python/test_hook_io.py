@@ -5,53 +5,62 @@ Unit tests for hook_io.py
 Tests the hook input parsing and response generation functions.
 """
 
-import json
-import sys
 import io
+import json
 import pytest
+from contextlib import redirect_stdout
 from unittest.mock import patch
 
-# Add the hooks/lib directory to the path
-sys.path.insert(0, 'hooks/lib')
-from hook_io import approve_with_message
+
+@pytest.fixture
+def parse_approve(approve_fn):
+    """Run approve_with_message into a plain StringIO and return its parsed JSON output."""
+    def _run(reason, event, context):
+        buf = io.StringIO()
+        with redirect_stdout(buf):
+            approve_fn(reason, event, context)
+        return json.loads(buf.getvalue())
+    return _run
 
 
 class TestApproveWithMessage:
     """Tests for approve_with_message function."""
 
-    def test_approve_with_context(self, capsys):
-        approve_with_message(
-            "Compilation failed",
-            "PostToolUse",
-            "## Error Details\n\nFix the errors."
-        )
-
-        captured = capsys.readouterr()
-        output = json.loads(captured.out)
-
-        assert output['decision'] == 'approve'
-        assert output['reason'] == 'Compilation failed'
-        assert output['hookSpecificOutput']['hookEventName'] == 'PostToolUse'
-        assert '## Error Details' in output['hookSpecificOutput']['additionalContext']
-
-    def test_approve_with_empty_context(self, capsys):
-        approve_with_message("Info", "PreToolUse", "")
+    @pytest.mark.parametrize("reason,event,context", [
+        ("Compilation failed", "PostToolUse", "## Error Details\n\nFix the errors."),
+        ("Info", "PreToolUse", ""),
+        ("reason", "event", "context"),
+        ("Waypoints", "UserPromptSubmit", "Workflow active"),
+        ("Waypoints", "SessionStart", "Resuming Phase 3"),
+        ("Stopped", "Stop", "ctx with \"quotes\" and \\ backslash"),
+        (None, "PostToolUse", None),
+    ], ids=["with_context", "empty_context", "plain", "user_prompt_submit", "session_start",
+            "stop_escaped", "none_reason_and_context"])
+    def test_output(self, parse_approve, reason, event, context):
+        output = parse_approve(reason, event, context)
 
-        captured = capsys.readouterr()
-        output = json.loads(captured.out)
-
-        assert output['decision'] == 'approve'
-        assert output['hookSpecificOutput']['additionalContext'] == ''
-
-    def test_output_structure(self, capsys):
-        approve_with_message("reason", "event", "context")
-
-        captured = capsys.readouterr()
-        output = json.loads(captured.out)
-
-        # Verify complete structure
         assert set(output.keys()) == {'decision', 'reason', 'hookSpecificOutput'}
         assert set(output['hookSpecificOutput'].keys()) == {'hookEventName', 'additionalContext'}
+        assert output['decision'] == 'approve'
+        assert output['reason'] == reason
+        assert output['hookSpecificOutput']['hookEventName'] == event
+        assert output['hookSpecificOutput']['additionalContext'] == context
+
+    def test_output_matches_json_dumps(self, approve_fn):
+        reason, event, context = "Compile \u2713", "PostToolUse", "line \"1\"\n\tline\\2 \U0001F600"
+        buf = io.StringIO()
+        with redirect_stdout(buf):
+            approve_fn(reason, event, context)
+
+        expected = json.dumps({
+            "decision": "approve",
+            "reason": reason,
+            "hookSpecificOutput": {
+                "hookEventName": event,
+                "additionalContext": context
+            }
+        }, indent=2)
+        assert buf.getvalue() == expected + "\n"
 
 
 if __name__ == '__main__':
@@ -5,51 +5,192 @@ Integration tests for Python hooks.
 Tests the hook scripts by simulating Claude Code hook input.
 """
 
+import functools
+import importlib.util
+import io
 import json
 import os
 import subprocess
 import sys
-import tempfile
+import traceback
 import pytest
+from contextlib import redirect_stderr, redirect_stdout
 from pathlib import Path
+from types import ModuleType
+from typing import Dict, NamedTuple
 from unittest.mock import patch
 
+from hook_io import HookInput
+
+try:
+    import orjson
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj).encode()
+    _loads = json.loads
+
+# Every test isolates HOME and project files under its own tmp_path, so the
+# module is safe to run with pytest-xdist (-n auto)
+pytestmark = pytest.mark.integration
+
 # Get the project root
 PROJECT_ROOT = Path(__file__).parent.parent.parent.parent
 MOCKS_DIR = PROJECT_ROOT / "tests" / "fixtures" / "mocks"
 
-
-def run_hook(hook_name: str, input_data: dict, env: dict = None, use_mocks: bool = False) -> tuple:
+# Hook name (script stem) -> absolute script path
+_HOOKS: Dict[str, str] = {p.stem: str(p) for p in (PROJECT_ROOT / "hooks").glob("*.py")}
+
+# Hook modules loaded for in-process runs, keyed by hook name
+_HOOK_MODULES: Dict[str, ModuleType] = {}
+
+
+def _load_hook(hook_name: str) -> ModuleType:
+    """Import a hook script as a module once, without running its main()."""
+    module = _HOOK_MODULES.get(hook_name)
+    if module is None:
+        spec = importlib.util.spec_from_file_location(hook_name.replace("-", "_"), _HOOKS[hook_name])
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        _HOOK_MODULES[hook_name] = module
+    return module
+
+
+def _run_hook_in_process(hook_name: str, input_data: str, env: dict = None) -> tuple:
+    """Call a hook's main() in this process with patched argv/stdin/stdout/stderr/environ."""
+    module = _load_hook(hook_name)
+    stdout, stderr = io.StringIO(), io.StringIO()
+    cwd = os.getcwd()
+    exit_code = 0
+
+    with patch.dict(os.environ, env or {}), \
+            patch.object(sys, "argv", [_HOOKS[hook_name]]), \
+            patch.object(sys, "stdin", io.StringIO(input_data)), \
+            redirect_stdout(stdout), redirect_stderr(stderr):
+        try:
+            module.main()
+        except SystemExit as e:
+            if e.code is None or isinstance(e.code, int):
+                exit_code = e.code or 0
+            else:
+                print(e.code, file=sys.stderr)
+                exit_code = 1
+        except Exception:
+            traceback.print_exc()
+            exit_code = 1
+        finally:
+            # Hooks chdir into the project directory
+            os.chdir(cwd)
+
+    return exit_code, stdout.getvalue(), stderr.getvalue()
+
+
+def run_hook(hook_name: str, input_data: str, env: dict = None, use_mocks: bool = False) -> tuple:
     """
     Run a Python hook script with the given input.
 
+    Hooks run in-process by calling their main(). Runs that need the mock
+    build tools on PATH use a subprocess, so the mocked commands stay out of
+    the test process.
+
     Args:
         hook_name: Name of the hook script (without .py)
-        input_data: Dict to pass as JSON stdin
+        input_data: JSON text to pass as stdin (from generate_hook_input)
         env: Additional environment variables
         use_mocks: If True, add mocks directory to PATH
 
     Returns (exit_code, stdout, stderr)
     """
-    hook_path = PROJECT_ROOT / "hooks" / f"{hook_name}.py"
-
-    full_env = os.environ.copy()
-    if env:
-        full_env.update(env)
+    if not use_mocks:
+        return _run_hook_in_process(hook_name, input_data, env)
 
-    # Add mocks to PATH if requested
-    if use_mocks:
-        full_env["PATH"] = f"{MOCKS_DIR}:{full_env.get('PATH', '')}"
+    # Built in one pass; mocks go first on PATH
+    env = env or {}
+    path = env.get("PATH", os.environ.get("PATH", ""))
+    full_env = {**os.environ, **env, "PATH": f"{MOCKS_DIR}:{path}"}
 
     result = subprocess.run(
-        ["python3", str(hook_path)],
-        input=json.dumps(input_data),
+        ["python3", _HOOKS[hook_name]],
+        input=input_data.encode(),
         capture_output=True,
-        text=True,
         env=full_env,
         timeout=30
     )
-    return result.returncode, result.stdout, result.stderr
+    return result.returncode, result.stdout.decode(), result.stderr.decode()
+
+
+_POM_BYTES = b"<project></project>"
+_PKG_JSON_BYTES = b'{"name": "test"}'
+_TSCONFIG_BYTES = b"{}"
+
+
+# Session state directory relative to HOME
+_MARKERS_SUBDIR = os.path.join(".claude", "tmp", "wp-test-session")
+
+
+def _write(path: str, data: bytes) -> None:
+    """Write bytes to path with a single open()."""
+    with open(path, "wb") as f:
+        f.write(data)
+
+
+def _maven_project(tmpdir: str) -> Path:
+    """Create tmpdir/project with a minimal pom.xml."""
+    project = os.path.join(tmpdir, "project")
+    os.makedirs(project, exist_ok=True)
+    _write(os.path.join(project, "pom.xml"), _POM_BYTES)
+    return Path(project)
+
+
+def _ts_project(tmpdir: str) -> Path:
+    """Create tmpdir/project with package.json and tsconfig.json."""
+    project = os.path.join(tmpdir, "project")
+    os.makedirs(project, exist_ok=True)
+    _write(os.path.join(project, "package.json"), _PKG_JSON_BYTES)
+    _write(os.path.join(project, "tsconfig.json"), _TSCONFIG_BYTES)
+    return Path(project)
+
+
+# Maven project paths per file kind, relative to the project root
+PHASE_GUARD_FILES = {
+    "main": Path("src") / "main" / "kotlin" / "Service.kt",
+    "test": Path("src") / "test" / "kotlin" / "ServiceTest.kt",
+    "config": Path("pom.xml"),
+    "yaml": Path("application.yaml"),
+}
+
+# (phase, file kind, expected decision)
+PHASE_GUARD_CASES = [
+    (1, "main", "block"), (1, "test", "block"), (1, "config", "allow"),
+    (2, "main", "allow"), (2, "test", "block"), (2, "config", "allow"),
+    (3, "main", "block"), (3, "test", "allow"), (3, "config", "allow"), (3, "yaml", "allow"),
+    (4, "main", "allow"), (4, "test", "allow"), (4, "config", "allow"),
+]
+
+
+class PhaseGuardEnv(NamedTuple):
+    """Shared layout for phase-guard tests."""
+    env: Dict[str, str]
+    markers_dir: Path
+    maven_project: Path
+    ts_project: Path
+
+
+# Default mock output per (command kind, success)
+_MOCK_DEFAULT_OUTPUT = {
+    ("compile", True): b"BUILD SUCCESS",
+    ("compile", False): b"[ERROR] Compilation failure\nSrc.kt:10: error: unresolved reference: foo",
+    ("test", True): b"Tests run: 10, Failures: 0",
+    ("test", False): b"Tests run: 10, Failures: 2\n\nFailed tests:\n  - testSomething\n  - testAnother",
+}
+
+
+def _write_mock_control(tmpdir: str, kind: str, success: bool, output: str = None) -> None:
+    """Write mock_<kind>_exit_code and mock_<kind>_output for the mock build scripts."""
+    data = _MOCK_DEFAULT_OUTPUT[kind, success] if output is None else output.encode()
+    _write(os.path.join(tmpdir, f"mock_{kind}_exit_code"), b"0" if success else b"1")
+    _write(os.path.join(tmpdir, f"mock_{kind}_output"), data)
 
 
 def setup_mock_compile(tmpdir: str, success: bool = True, output: str = None) -> None:
@@ -61,12 +202,7 @@ def setup_mock_compile(tmpdir: str, success: bool = True, output: str = None) ->
         success: If True, compile succeeds; if False, fails
         output: Custom output message (optional)
     """
-    exit_code = "0" if success else "1"
-    if output is None:
-        output = "BUILD SUCCESS" if success else "[ERROR] Compilation failure\nSrc.kt:10: error: unresolved reference: foo"
-
-    Path(tmpdir, "mock_compile_exit_code").write_text(exit_code)
-    Path(tmpdir, "mock_compile_output").write_text(output)
+    _write_mock_control(tmpdir, "compile", success, output)
 
 
 def setup_mock_test(tmpdir: str, success: bool = True, output: str = None) -> None:
@@ -78,37 +214,19 @@ def setup_mock_test(tmpdir: str, success: bool = True, output: str = None) -> No
         success: If True, tests pass; if False, tests fail
         output: Custom output message (optional)
     """
-    exit_code = "0" if success else "1"
-    if output is None:
-        output = "Tests run: 10, Failures: 0" if success else "Tests run: 10, Failures: 2\n\nFailed tests:\n  - testSomething\n  - testAnother"
+    _write_mock_control(tmpdir, "test", success, output)
 
-    Path(tmpdir, "mock_test_exit_code").write_text(exit_code)
-    Path(tmpdir, "mock_test_output").write_text(output)
 
-
-def setup_wp_state(
-    markers_dir: Path,
+def _build_state(
     phase: int = 1,
     active: bool = True,
     requirements_complete: bool = False,
     interfaces_complete: bool = False,
     tests_complete: bool = False,
     implementation_complete: bool = False
-) -> None:
-    """
-    Set up WP state.json file for testing.
-
-    Args:
-        markers_dir: The markers directory path
-        phase: Current WP phase (1-4)
-        active: Whether WP mode is active
-        requirements_complete: Whether requirements phase is complete
-        interfaces_complete: Whether interfaces phase is complete
-        tests_complete: Whether tests phase is complete
-        implementation_complete: Whether implementation phase is complete
-    """
-    markers_dir.mkdir(parents=True, exist_ok=True)
-    state = {
+) -> dict:
+    """Build a WP state.json payload."""
+    return {
         "version": 1,
         "active": active,
         "supervisorActive": False,
@@ -131,7 +249,40 @@ def setup_wp_state(
             "sessionId": "test-session"
         }
     }
-    (markers_dir / "state.json").write_text(json.dumps(state, indent=2))
+
+
+@functools.lru_cache(maxsize=64)
+def _serialize_state(*args) -> bytes:
+    """state.json bytes for _build_state(*args); tests reuse a handful of variants."""
+    return _dumps(_build_state(*args))
+
+
+def setup_wp_state(
+    markers_dir: Path,
+    phase: int = 1,
+    active: bool = True,
+    requirements_complete: bool = False,
+    interfaces_complete: bool = False,
+    tests_complete: bool = False,
+    implementation_complete: bool = False
+) -> None:
+    """
+    Set up WP state.json file for testing.
+
+    Args:
+        markers_dir: The markers directory path
+        phase: Current WP phase (1-4)
+        active: Whether WP mode is active
+        requirements_complete: Whether requirements phase is complete
+        interfaces_complete: Whether interfaces phase is complete
+        tests_complete: Whether tests phase is complete
+        implementation_complete: Whether implementation phase is complete
+    """
+    os.makedirs(markers_dir, exist_ok=True)
+    _write(os.path.join(markers_dir, "state.json"), _serialize_state(
+        phase, active, requirements_complete, interfaces_complete,
+        tests_complete, implementation_complete
+    ))
 
 
 def get_wp_state(markers_dir: Path) -> dict:
@@ -139,7 +290,7 @@ def get_wp_state(markers_dir: Path) -> dict:
     state_file = markers_dir / "state.json"
     if not state_file.exists():
         return None
-    return json.loads(state_file.read_text())
+    return _loads(state_file.read_bytes())
 
 
 def get_wp_phase(markers_dir: Path) -> int:
@@ -150,6 +301,7 @@ def get_wp_phase(markers_dir: Path) -> int:
     return state.get("phase", 1)
 
 
+@functools.lru_cache(maxsize=256)
 def generate_hook_input(
     tool_name: str = "Write",
     file_path: str = "/project/src/main.py",
@@ -157,16 +309,67 @@ def generate_hook_input(
     session_id: str = "test-session",
     hook_event_name: str = "",
     stop_hook_active: bool = False
-) -> dict:
-    """Generate hook input JSON."""
-    return {
+) -> str:
+    """Generate hook input JSON. Cached, since tests repeat a few shapes."""
+    return _dumps({
         "tool_name": tool_name,
         "tool_input": {"file_path": file_path},
         "cwd": cwd,
         "session_id": session_id,
         "hook_event_name": hook_event_name,
         "stop_hook_active": stop_hook_active,
-    }
+    }).decode()
+
+
+@pytest.fixture
+def home_dir(tmp_path):
+    """Temporary HOME for a hook run."""
+    return str(tmp_path)
+
+
+@pytest.fixture(autouse=True)
+def hook_env(monkeypatch, home_dir):
+    """Point HOME, WP_INSTALL_DIR and the mock build tools' TEST_TMP at this test's dirs."""
+    monkeypatch.setenv("HOME", home_dir)
+    monkeypatch.setenv("WP_INSTALL_DIR", str(PROJECT_ROOT))
+    monkeypatch.setenv("TEST_TMP", home_dir)
+
+
+@pytest.fixture
+def markers_dir(home_dir):
+    """Session state directory under home_dir (created by setup_wp_state)."""
+    return Path(home_dir, _MARKERS_SUBDIR)
+
+
+@pytest.fixture
+def project_dir(home_dir):
+    """Maven project directory (pom.xml only) under home_dir."""
+    return _maven_project(home_dir)
+
+
+@pytest.fixture
+def ts_project_dir(home_dir):
+    """TypeScript project directory (package.json + tsconfig.json) under home_dir."""
+    return _ts_project(home_dir)
+
+
+@pytest.fixture(scope="class")
+def phase_guard_env(tmp_path_factory):
+    """HOME, session dir and Maven/TypeScript projects, built once for the class."""
+    home = tmp_path_factory.mktemp("phase-guard")
+    return PhaseGuardEnv(
+        env={"HOME": str(home), "WP_INSTALL_DIR": str(PROJECT_ROOT)},
+        markers_dir=Path(home, _MARKERS_SUBDIR),
+        maven_project=_maven_project(home / "maven"),
+        ts_project=_ts_project(home / "ts"),
+    )
+
+
+@pytest.fixture
+def wp_phase(phase_guard_env, request):
+    """Rewrite the shared session's state.json for the phase in request.param."""
+    setup_wp_state(phase_guard_env.markers_dir, phase=request.param)
+    return request.param
 
 
 class TestCleanupMarkersHook:
@@ -181,92 +384,74 @@ class TestCleanupMarkersHook:
         assert exit_code == 0
         assert stdout == ""
 
-    def test_cleans_up_on_session_end(self):
+    def test_cleans_up_on_session_end(self, markers_dir):
         """Should clean up markers on SessionEnd."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            # Create marker directory with markers
-            markers_dir = Path(tmpdir) / ".claude" / "tmp" / "wp-test-session"
-            markers_dir.mkdir(parents=True)
-            setup_wp_state(markers_dir, phase=2)
-
-            # Mock home directory
-            env = {"HOME": tmpdir}
-            input_data = generate_hook_input(
-                hook_event_name="SessionEnd",
-                session_id="test-session"
-            )
-
-            exit_code, stdout, stderr = run_hook("wp-cleanup-markers", input_data, env)
-
-            assert exit_code == 0
-            # Markers should be cleaned up
-            assert not markers_dir.exists()
-
-    def test_cleans_up_all_wp_state(self):
+        setup_wp_state(markers_dir, phase=2)
+
+        input_data = generate_hook_input(
+            hook_event_name="SessionEnd",
+            session_id="test-session"
+        )
+
+        exit_code, stdout, stderr = run_hook("wp-cleanup-markers", input_data)
+
+        assert exit_code == 0
+        # Markers should be cleaned up
+        assert not markers_dir.exists()
+
+    def test_cleans_up_all_wp_state(self, markers_dir):
         """Should clean up all WP state on SessionEnd."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            markers_dir = Path(tmpdir) / ".claude" / "tmp" / "wp-test-session"
-            markers_dir.mkdir(parents=True)
-
-            # Create state with all phases complete
-            setup_wp_state(
-                markers_dir,
-                phase=4,
-                requirements_complete=True,
-                interfaces_complete=True,
-                tests_complete=True,
-                implementation_complete=True
-            )
-
-            # Verify state exists
-            assert (markers_dir / "state.json").exists()
-
-            env = {"HOME": tmpdir}
-            input_data = generate_hook_input(
-                hook_event_name="SessionEnd",
-                session_id="test-session"
-            )
-
-            exit_code, stdout, stderr = run_hook("wp-cleanup-markers", input_data, env)
-
-            assert exit_code == 0
-            # Directory should be gone
-            assert not markers_dir.exists()
+        # Create state with all phases complete
+        setup_wp_state(
+            markers_dir,
+            phase=4,
+            requirements_complete=True,
+            interfaces_complete=True,
+            tests_complete=True,
+            implementation_complete=True
+        )
+
+        # Verify state exists
+        assert (markers_dir / "state.json").exists()
+
+        input_data = generate_hook_input(
+            hook_event_name="SessionEnd",
+            session_id="test-session"
+        )
+
+        exit_code, stdout, stderr = run_hook("wp-cleanup-markers", input_data)
+
+        assert exit_code == 0
+        # Directory should be gone
+        assert not markers_dir.exists()
 
     def test_handles_missing_markers_gracefully(self):
         """Should handle missing markers gracefully."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            # Don't create any markers
-            env = {"HOME": tmpdir}
-            input_data = generate_hook_input(
-                hook_event_name="SessionEnd",
-                session_id="test-session"
-            )
+        # Don't create any markers
+        input_data = generate_hook_input(
+            hook_event_name="SessionEnd",
+            session_id="test-session"
+        )
 
-            exit_code, stdout, stderr = run_hook("wp-cleanup-markers", input_data, env)
+        exit_code, stdout, stderr = run_hook("wp-cleanup-markers", input_data)
 
-            assert exit_code == 0
+        assert exit_code == 0
 
-    def test_handles_partial_state(self):
+    def test_handles_partial_state(self, markers_dir):
         """Should handle partial state (only some phases complete)."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            markers_dir = Path(tmpdir) / ".claude" / "tmp" / "wp-test-session"
-            markers_dir.mkdir(parents=True)
+        # Create state with only requirements complete
+        setup_wp_state(markers_dir, phase=1, requirements_complete=True)
 
-            # Create state with only requirements complete
-            setup_wp_state(markers_dir, phase=1, requirements_complete=True)
+        input_data = generate_hook_input(
+            hook_event_name="SessionEnd",
+            session_id="test-session"
+        )
 
-            env = {"HOME": tmpdir}
-            input_data = generate_hook_input(
-                hook_event_name="SessionEnd",
-                session_id="test-session"
-            )
-
-            exit_code, stdout, stderr = run_hook("wp-cleanup-markers", input_data, env)
+        exit_code, stdout, stderr = run_hook("wp-cleanup-markers", input_data)
 
-            assert exit_code == 0
-            # All should be gone
-            assert not markers_dir.exists()
+        assert exit_code == 0
+        # All should be gone
+        assert not markers_dir.exists()
 
 
 class TestPhaseGuardHook:
@@ -274,886 +459,415 @@ class TestPhaseGuardHook:
 
     def test_allows_when_wp_inactive(self):
         """Should allow all operations when Waypoints is not active."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            env = {"HOME": tmpdir, "WP_INSTALL_DIR": str(PROJECT_ROOT)}
-            input_data = generate_hook_input()
+        input_data = generate_hook_input()
 
-            exit_code, stdout, stderr = run_hook("wp-phase-guard", input_data, env)
+        exit_code, stdout, stderr = run_hook("wp-phase-guard", input_data)
 
-            assert exit_code == 0
-            assert stdout == ""  # Empty output = allow
+        assert exit_code == 0
+        assert stdout == ""  # Empty output = allow
 
-    def test_allows_test_edits_when_wp_inactive(self):
-        """Should allow test file edits when Waypoints is not active."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            project_dir = Path(tmpdir) / "project"
-            project_dir.mkdir()
-            (project_dir / "pom.xml").write_text("<project></project>")
+    def test_inactive_session_leaves_no_state_directory(self, markers_dir):
+        """Should exit before creating any session state when Waypoints never started."""
+        input_data = generate_hook_input()
 
-            env = {"HOME": tmpdir, "WP_INSTALL_DIR": str(PROJECT_ROOT)}
-            input_data = generate_hook_input(
-                file_path=str(project_dir / "src" / "test" / "kotlin" / "ServiceTest.kt"),
-                cwd=str(project_dir)
-            )
+        exit_code, stdout, stderr = run_hook("wp-phase-guard", input_data)
 
-            exit_code, stdout, stderr = run_hook("wp-phase-guard", input_data, env)
+        assert exit_code == 0
+        assert stdout == ""
+        assert not markers_dir.exists()
 
-            assert exit_code == 0
-            assert stdout == ""
+    def test_allows_test_edits_when_wp_inactive(self, project_dir):
+        """Should allow test file edits when Waypoints is not active."""
+        input_data = generate_hook_input(
+            file_path=str(project_dir / "src" / "test" / "kotlin" / "ServiceTest.kt"),
+            cwd=str(project_dir)
+        )
 
-    def test_allows_non_write_edit_tools(self):
-        """Should allow non-Write/Edit tools."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            # Create WP mode marker
-            markers_dir = Path(tmpdir) / ".claude" / "tmp" / "wp-test-session"
-            markers_dir.mkdir(parents=True)
-            setup_wp_state(markers_dir, phase=1)
+        exit_code, stdout, stderr = run_hook("wp-phase-guard", input_data)
 
-            env = {"HOME": tmpdir, "WP_INSTALL_DIR": str(PROJECT_ROOT)}
-            input_data = generate_hook_input(tool_name="Read")
+        assert exit_code == 0
+        assert stdout == ""
 
-            exit_code, stdout, stderr = run_hook("wp-phase-guard", input_data, env)
+    def test_allows_non_write_edit_tools(self, markers_dir):
+        """Should allow non-Write/Edit tools."""
+        # Create WP mode marker
+        setup_wp_state(markers_dir, phase=1)
 
-            assert exit_code == 0
-            assert stdout == ""  # Empty output = allow
+        input_data = generate_hook_input(tool_name="Read")
 
-    def test_handles_edit_tool_same_as_write(self):
-        """Should handle Edit tool same as Write."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            markers_dir = Path(tmpdir) / ".claude" / "tmp" / "wp-test-session"
-            markers_dir.mkdir(parents=True)
-            setup_wp_state(markers_dir, phase=1)
-
-            project_dir = Path(tmpdir) / "project"
-            project_dir.mkdir()
-            (project_dir / "pom.xml").write_text("<project></project>")
-
-            env = {"HOME": tmpdir, "WP_INSTALL_DIR": str(PROJECT_ROOT)}
-            input_data = generate_hook_input(
-                tool_name="Edit",
-                file_path=str(project_dir / "src" / "main" / "kotlin" / "Service.kt"),
-                cwd=str(project_dir)
-            )
-
-            exit_code, stdout, stderr = run_hook("wp-phase-guard", input_data, env)
-
-            assert exit_code == 0
-            if stdout:
-                response = json.loads(stdout)
-                assert response.get("decision") == "block"
-
-    def test_blocks_source_edit_in_phase_1(self):
-        """Should block source file edits in Phase 1."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            # Create WP mode marker in phase 1
-            markers_dir = Path(tmpdir) / ".claude" / "tmp" / "wp-test-session"
-            markers_dir.mkdir(parents=True)
-            setup_wp_state(markers_dir, phase=1)
-
-            # Create a mock project with pom.xml for profile detection
-            project_dir = Path(tmpdir) / "project"
-            project_dir.mkdir()
-            (project_dir / "pom.xml").write_text("<project></project>")
-
-            env = {"HOME": tmpdir, "WP_INSTALL_DIR": str(PROJECT_ROOT)}
-            input_data = generate_hook_input(
-                file_path=str(project_dir / "src" / "main" / "kotlin" / "Service.kt"),
-                cwd=str(project_dir)
-            )
-
-            exit_code, stdout, stderr = run_hook("wp-phase-guard", input_data, env)
-
-            assert exit_code == 0
-            if stdout:  # If there's output, it should be a block
-                response = json.loads(stdout)
-                assert response.get("decision") == "block"
-                assert "Phase 1" in response.get("reason", "")
-
-    def test_phase_1_blocks_test_source_edits(self):
-        """Should block test file edits in Phase 1."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            markers_dir = Path(tmpdir) / ".claude" / "tmp" / "wp-test-session"
-            markers_dir.mkdir(parents=True)
-            setup_wp_state(markers_dir, phase=1)
-
-            project_dir = Path(tmpdir) / "project"
-            project_dir.mkdir()
-            (project_dir / "pom.xml").write_text("<project></project>")
-
-            env = {"HOME": tmpdir, "WP_INSTALL_DIR": str(PROJECT_ROOT)}
-            input_data = generate_hook_input(
-                file_path=str(project_dir / "src" / "test" / "kotlin" / "ServiceTest.kt"),
-                cwd=str(project_dir)
-            )
-
-            exit_code, stdout, stderr = run_hook("wp-phase-guard", input_data, env)
-
-            assert exit_code == 0
-            if stdout:
-                response = json.loads(stdout)
-                assert response.get("decision") == "block"
-
-    def test_phase_1_allows_config_file_edits(self):
-        """Should allow config file edits in Phase 1."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            markers_dir = Path(tmpdir) / ".claude" / "tmp" / "wp-test-session"
-            markers_dir.mkdir(parents=True)
-            setup_wp_state(markers_dir, phase=1)
-
-            project_dir = Path(tmpdir) / "project"
-            project_dir.mkdir()
-            (project_dir / "pom.xml").write_text("<project></project>")
-
-            env = {"HOME": tmpdir, "WP_INSTALL_DIR": str(PROJECT_ROOT)}
-            input_data = generate_hook_input(
-                file_path=str(project_dir / "pom.xml"),
-                cwd=str(project_dir)
-            )
-
-            exit_code, stdout, stderr = run_hook("wp-phase-guard", input_data, env)
-
-            assert exit_code == 0
-            # Should not block config files
-            if stdout:
-                response = json.loads(stdout)
-                assert response.get("decision") != "block"
-
-    def test_phase_2_allows_main_source_edits(self):
-        """Should allow main source edits in Phase 2."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            markers_dir = Path(tmpdir) / ".claude" / "tmp" / "wp-test-session"
-            markers_dir.mkdir(parents=True)
-            setup_wp_state(markers_dir, phase=2)
-
-            project_dir = Path(tmpdir) / "project"
-            project_dir.mkdir()
-            (project_dir / "pom.xml").write_text("<project></project>")
-
-            env = {"HOME": tmpdir, "WP_INSTALL_DIR": str(PROJECT_ROOT)}
-            input_data = generate_hook_input(
-                file_path=str(project_dir / "src" / "main" / "kotlin" / "Service.kt"),
-                cwd=str(project_dir)
-            )
-
-            exit_code, stdout, stderr = run_hook("wp-phase-guard", input_data, env)
-
-            assert exit_code == 0
-            assert stdout == ""  # No output means allowed
+        exit_code, stdout, stderr = run_hook("wp-phase-guard", input_data)
 
-    def test_phase_2_blocks_test_source_edits(self):
-        """Should block test file edits in Phase 2."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            markers_dir = Path(tmpdir) / ".claude" / "tmp" / "wp-test-session"
-            markers_dir.mkdir(parents=True)
-            setup_wp_state(markers_dir, phase=2)
-
-            project_dir = Path(tmpdir) / "project"
-            project_dir.mkdir()
-            (project_dir / "pom.xml").write_text("<project></project>")
-
-            env = {"HOME": tmpdir, "WP_INSTALL_DIR": str(PROJECT_ROOT)}
-            input_data = generate_hook_input(
-                file_path=str(project_dir / "src" / "test" / "kotlin" / "ServiceTest.kt"),
-                cwd=str(project_dir)
-            )
-
-            exit_code, stdout, stderr = run_hook("wp-phase-guard", input_data, env)
-
-            assert exit_code == 0
-            if stdout:
-                response = json.loads(stdout)
-                assert response.get("decision") == "block"
-                assert "Phase 2" in response.get("reason", "")
-
-    def test_phase_2_allows_config_file_edits(self):
-        """Should allow config file edits in Phase 2."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            markers_dir = Path(tmpdir) / ".claude" / "tmp" / "wp-test-session"
-            markers_dir.mkdir(parents=True)
-            setup_wp_state(markers_dir, phase=2)
-
-            project_dir = Path(tmpdir) / "project"
-            project_dir.mkdir()
-            (project_dir / "pom.xml").write_text("<project></project>")
-
-            env = {"HOME": tmpdir, "WP_INSTALL_DIR": str(PROJECT_ROOT)}
-            input_data = generate_hook_input(
-                file_path=str(project_dir / "pom.xml"),
-                cwd=str(project_dir)
-            )
-
-            exit_code, stdout, stderr = run_hook("wp-phase-guard", input_data, env)
-
-            assert exit_code == 0
-            # Should not block config files
-            if stdout:
-                response = json.loads(stdout)
-                assert response.get("decision") != "block"
-
-    def test_phase_3_blocks_main_source_edits(self):
-        """Should block main source edits in Phase 3."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            markers_dir = Path(tmpdir) / ".claude" / "tmp" / "wp-test-session"
-            markers_dir.mkdir(parents=True)
-            setup_wp_state(markers_dir, phase=3)
-
-            project_dir = Path(tmpdir) / "project"
-            project_dir.mkdir()
-            (project_dir / "pom.xml").write_text("<project></project>")
-
-            env = {"HOME": tmpdir, "WP_INSTALL_DIR": str(PROJECT_ROOT)}
-            input_data = generate_hook_input(
-                file_path=str(project_dir / "src" / "main" / "kotlin" / "Service.kt"),
-                cwd=str(project_dir)
-            )
-
-            exit_code, stdout, stderr = run_hook("wp-phase-guard", input_data, env)
-
-            assert exit_code == 0
-            if stdout:
-                response = json.loads(stdout)
-                assert response.get("decision") == "block"
-                assert "Phase 3" in response.get("reason", "")
-
-    def test_phase_3_allows_test_source_edits(self):
-        """Should allow test file edits in Phase 3."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            markers_dir = Path(tmpdir) / ".claude" / "tmp" / "wp-test-session"
-            markers_dir.mkdir(parents=True)
-            setup_wp_state(markers_dir, phase=3)
-
-            project_dir = Path(tmpdir) / "project"
-            project_dir.mkdir()
-            (project_dir / "pom.xml").write_text("<project></project>")
-
-            env = {"HOME": tmpdir, "WP_INSTALL_DIR": str(PROJECT_ROOT)}
-            input_data = generate_hook_input(
-                file_path=str(project_dir / "src" / "test" / "kotlin" / "ServiceTest.kt"),
-                cwd=str(project_dir)
-            )
-
-            exit_code, stdout, stderr = run_hook("wp-phase-guard", input_data, env)
-
-            assert exit_code == 0
-            assert stdout == ""  # No output means allowed
+        assert exit_code == 0
+        assert stdout == ""  # Empty output = allow
 
-    def test_phase_3_allows_config_file_edits(self):
-        """Should allow config file edits in Phase 3."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            markers_dir = Path(tmpdir) / ".claude" / "tmp" / "wp-test-session"
-            markers_dir.mkdir(parents=True)
-            setup_wp_state(markers_dir, phase=3)
-
-            project_dir = Path(tmpdir) / "project"
-            project_dir.mkdir()
-            (project_dir / "pom.xml").write_text("<project></project>")
-
-            env = {"HOME": tmpdir, "WP_INSTALL_DIR": str(PROJECT_ROOT)}
-            input_data = generate_hook_input(
-                file_path=str(project_dir / "application.yaml"),
-                cwd=str(project_dir)
-            )
-
-            exit_code, stdout, stderr = run_hook("wp-phase-guard", input_data, env)
-
-            assert exit_code == 0
-            # Should not block config files
-            if stdout:
-                response = json.loads(stdout)
-                assert response.get("decision") != "block"
-
-    def test_phase_4_allows_main_source_edits(self):
-        """Should allow main source edits in Phase 4."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            markers_dir = Path(tmpdir) / ".claude" / "tmp" / "wp-test-session"
-            markers_dir.mkdir(parents=True)
-            setup_wp_state(markers_dir, phase=4)
-
-            project_dir = Path(tmpdir) / "project"
-            project_dir.mkdir()
-            (project_dir / "pom.xml").write_text("<project></project>")
-
-            env = {"HOME": tmpdir, "WP_INSTALL_DIR": str(PROJECT_ROOT)}
-            input_data = generate_hook_input(
-                file_path=str(project_dir / "src" / "main" / "kotlin" / "Service.kt"),
-                cwd=str(project_dir)
-            )
-
-            exit_code, stdout, stderr = run_hook("wp-phase-guard", input_data, env)
-
-            assert exit_code == 0
-            assert stdout == ""  # No output means allowed
+    @pytest.mark.parametrize("wp_phase", [1], indirect=True)
+    def test_handles_edit_tool_same_as_write(self, phase_guard_env, wp_phase):
+        """Should handle Edit tool same as Write."""
+        project_dir = phase_guard_env.maven_project
+        input_data = generate_hook_input(
+            tool_name="Edit",
+            file_path=str(project_dir / "src" / "main" / "kotlin" / "Service.kt"),
+            cwd=str(project_dir)
+        )
 
-    def test_phase_4_allows_test_source_edits(self):
-        """Should allow test file edits in Phase 4."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            markers_dir = Path(tmpdir) / ".claude" / "tmp" / "wp-test-session"
-            markers_dir.mkdir(parents=True)
-            setup_wp_state(markers_dir, phase=4)
+        exit_code, stdout, stderr = run_hook("wp-phase-guard", input_data, phase_guard_env.env)
 
-            project_dir = Path(tmpdir) / "project"
-            project_dir.mkdir()
-            (project_dir / "pom.xml").write_text("<project></project>")
+        assert exit_code == 0
+        if stdout:
+            response = _loads(stdout)
+            assert response.get("decision") == "block"
 
-            env = {"HOME": tmpdir, "WP_INSTALL_DIR": str(PROJECT_ROOT)}
-            input_data = generate_hook_input(
-                file_path=str(project_dir / "src" / "test" / "kotlin" / "ServiceTest.kt"),
-                cwd=str(project_dir)
-            )
+    @pytest.mark.parametrize("wp_phase,kind,expected", PHASE_GUARD_CASES, indirect=["wp_phase"])
+    def test_phase_guard(self, phase_guard_env, wp_phase, kind, expected):
+        """Should block or allow each file kind according to the phase."""
+        project_dir = phase_guard_env.maven_project
+        input_data = generate_hook_input(
+            file_path=str(project_dir / PHASE_GUARD_FILES[kind]),
+            cwd=str(project_dir)
+        )
 
-            exit_code, stdout, stderr = run_hook("wp-phase-guard", input_data, env)
+        exit_code, stdout, stderr = run_hook("wp-phase-guard", input_data, phase_guard_env.env)
 
-            assert exit_code == 0
+        assert exit_code == 0
+        if expected == "allow":
             assert stdout == ""  # No output means allowed
+        else:
+            response = _loads(stdout)
+            assert response.get("decision") == "block"
+            assert f"Phase {wp_phase}" in response.get("reason", "")
 
-    def test_phase_4_allows_config_file_edits(self):
-        """Should allow config file edits in Phase 4."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            markers_dir = Path(tmpdir) / ".claude" / "tmp" / "wp-test-session"
-            markers_dir.mkdir(parents=True)
-            setup_wp_state(markers_dir, phase=4)
-
-            project_dir = Path(tmpdir) / "project"
-            project_dir.mkdir()
-            (project_dir / "pom.xml").write_text("<project></project>")
-
-            env = {"HOME": tmpdir, "WP_INSTALL_DIR": str(PROJECT_ROOT)}
-            input_data = generate_hook_input(
-                file_path=str(project_dir / "pom.xml"),
-                cwd=str(project_dir)
-            )
+    @pytest.mark.parametrize("wp_phase", [2], indirect=True)
+    def test_typescript_phase_2_blocks_test_files(self, phase_guard_env, wp_phase):
+        """Should block test files for TypeScript project in Phase 2."""
+        ts_project_dir = phase_guard_env.ts_project
+        input_data = generate_hook_input(
+            file_path=str(ts_project_dir / "src" / "service.test.ts"),
+            cwd=str(ts_project_dir)
+        )
 
-            exit_code, stdout, stderr = run_hook("wp-phase-guard", input_data, env)
+        exit_code, stdout, stderr = run_hook("wp-phase-guard", input_data, phase_guard_env.env)
 
-            assert exit_code == 0
-            # Should not block config files
-            if stdout:
-                response = json.loads(stdout)
-                assert response.get("decision") != "block"
+        assert exit_code == 0
+        if stdout:
+            response = _loads(stdout)
+            assert response.get("decision") == "block"
 
-    def test_typescript_phase_2_blocks_test_files(self):
-        """Should block test files for TypeScript project in Phase 2."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            markers_dir = Path(tmpdir) / ".claude" / "tmp" / "wp-test-session"
-            markers_dir.mkdir(parents=True)
-            setup_wp_state(markers_dir, phase=2)
-
-            project_dir = Path(tmpdir) / "project"
-            project_dir.mkdir()
-            (project_dir / "package.json").write_text('{"name": "test"}')
-            (project_dir / "tsconfig.json").write_text('{}')
-
-            env = {"HOME": tmpdir, "WP_INSTALL_DIR": str(PROJECT_ROOT)}
-            input_data = generate_hook_input(
-                file_path=str(project_dir / "src" / "service.test.ts"),
-                cwd=str(project_dir)
-            )
-
-            exit_code, stdout, stderr = run_hook("wp-phase-guard", input_data, env)
-
-            assert exit_code == 0
-            if stdout:
-                response = json.loads(stdout)
-                assert response.get("decision") == "block"
-
-    def test_typescript_phase_3_allows_test_files(self):
+    @pytest.mark.parametrize("wp_phase", [3], indirect=True)
+    def test_typescript_phase_3_allows_test_files(self, phase_guard_env, wp_phase):
         """Should allow test files for TypeScript project in Phase 3."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            markers_dir = Path(tmpdir) / ".claude" / "tmp" / "wp-test-session"
-            markers_dir.mkdir(parents=True)
-            setup_wp_state(markers_dir, phase=3)
-
-            project_dir = Path(tmpdir) / "project"
-            project_dir.mkdir()
-            (project_dir / "package.json").write_text('{"name": "test"}')
-            (project_dir / "tsconfig.json").write_text('{}')
+        ts_project_dir = phase_guard_env.ts_project
+        input_data = generate_hook_input(
+            file_path=str(ts_project_dir / "src" / "service.test.ts"),
+            cwd=str(ts_project_dir)
+        )
 
-            env = {"HOME": tmpdir, "WP_INSTALL_DIR": str(PROJECT_ROOT)}
-            input_data = generate_hook_input(
-                file_path=str(project_dir / "src" / "service.test.ts"),
-                cwd=str(project_dir)
-            )
+        exit_code, stdout, stderr = run_hook("wp-phase-guard", input_data, phase_guard_env.env)
 
-            exit_code, stdout, stderr = run_hook("wp-phase-guard", input_data, env)
-
-            assert exit_code == 0
-            assert stdout == ""  # No output means allowed
+        assert exit_code == 0
+        assert stdout == ""  # No output means allowed
 
 
 class TestAutoCompileHook:
     """Tests for wp-auto-compile.py"""
 
-    def test_compiles_after_source_file_change_success(self):
+    def test_compiles_after_source_file_change_success(self, home_dir, project_dir):
         """Should compile successfully after kotlin source file change."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            project_dir = Path(tmpdir) / "project"
-            project_dir.mkdir()
-            (project_dir / "pom.xml").write_text("<project></project>")
-
-            # Set up mock to succeed
-            setup_mock_compile(tmpdir, success=True)
-
-            env = {
-                "HOME": tmpdir,
-                "WP_INSTALL_DIR": str(PROJECT_ROOT),
-                "TEST_TMP": tmpdir
-            }
-            input_data = generate_hook_input(
-                file_path=str(project_dir / "src" / "main" / "kotlin" / "Service.kt"),
-                cwd=str(project_dir)
-            )
-
-            exit_code, stdout, stderr = run_hook("wp-auto-compile", input_data, env, use_mocks=True)
-            assert exit_code == 0
-            assert "Auto-compiling" in stderr
-            assert "Compilation successful" in stderr
-
-    def test_compiles_after_source_file_change_failure(self):
+        # Set up mock to succeed
+        setup_mock_compile(home_dir, success=True)
+
+        input_data = generate_hook_input(
+            file_path=str(project_dir / "src" / "main" / "kotlin" / "Service.kt"),
+            cwd=str(project_dir)
+        )
+
+        exit_code, stdout, stderr = run_hook("wp-auto-compile", input_data, use_mocks=True)
+        assert exit_code == 0
+        assert "Auto-compiling" in stderr
+        assert "Compilation successful" in stderr
+
+    def test_compiles_after_source_file_change_failure(self, home_dir, project_dir):
         """Should handle compilation failure and output error context."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            project_dir = Path(tmpdir) / "project"
-            project_dir.mkdir()
-            (project_dir / "pom.xml").write_text("<project></project>")
-
-            # Set up mock to fail with error output
-            setup_mock_compile(tmpdir, success=False, output="[ERROR] Service.kt:15: unresolved reference: myVar")
-
-            env = {
-                "HOME": tmpdir,
-                "WP_INSTALL_DIR": str(PROJECT_ROOT),
-                "TEST_TMP": tmpdir
-            }
-            input_data = generate_hook_input(
-                file_path=str(project_dir / "src" / "main" / "kotlin" / "Service.kt"),
-                cwd=str(project_dir)
-            )
-
-            exit_code, stdout, stderr = run_hook("wp-auto-compile", input_data, env, use_mocks=True)
-            assert exit_code == 0
-            assert "Compilation failed" in stderr
-            # Should output approve with error context
-            if stdout:
-                response = json.loads(stdout)
-                assert response.get("decision") == "approve"
-                assert "Compilation failed" in response.get("reason", "")
-
-    def test_skips_non_source_files(self):
+        # Set up mock to fail with error output
+        setup_mock_compile(home_dir, success=False, output="[ERROR] Service.kt:15: unresolved reference: myVar")
+
+        input_data = generate_hook_input(
+            file_path=str(project_dir / "src" / "main" / "kotlin" / "Service.kt"),
+            cwd=str(project_dir)
+        )
+
+        exit_code, stdout, stderr = run_hook("wp-auto-compile", input_data, use_mocks=True)
+        assert exit_code == 0
+        assert "Compilation failed" in stderr
+        # Should output approve with error context
+        if stdout:
+            response = _loads(stdout)
+            assert response.get("decision") == "approve"
+            assert "Compilation failed" in response.get("reason", "")
+
+    def test_skips_non_source_files(self, project_dir):
         """Should skip non-source files like README."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            project_dir = Path(tmpdir) / "project"
-            project_dir.mkdir()
-            (project_dir / "pom.xml").write_text("<project></project>")
-
-            env = {"HOME": tmpdir, "WP_INSTALL_DIR": str(PROJECT_ROOT)}
-            input_data = generate_hook_input(
-                file_path=str(project_dir / "README.md"),
-                cwd=str(project_dir)
-            )
-
-            exit_code, stdout, stderr = run_hook("wp-auto-compile", input_data, env)
-            assert exit_code == 0
-            assert stdout == ""
-            assert "Auto-compiling" not in stderr
-
-    def test_skips_non_write_edit_tools(self):
+        input_data = generate_hook_input(
+            file_path=str(project_dir / "README.md"),
+            cwd=str(project_dir)
+        )
+
+        exit_code, stdout, stderr = run_hook("wp-auto-compile", input_data)
+        assert exit_code == 0
+        assert stdout == ""
+        assert "Auto-compiling" not in stderr
+
+    def test_skips_missing_project_directory(self, home_dir):
+        """Should exit quietly when cwd does not exist."""
+        project_dir = Path(home_dir) / "missing"
+
+        input_data = generate_hook_input(
+            file_path=str(project_dir / "src" / "main" / "kotlin" / "Service.kt"),
+            cwd=str(project_dir)
+        )
+
+        exit_code, stdout, stderr = run_hook("wp-auto-compile", input_data)
+        assert exit_code == 0
+        assert stdout == ""
+        assert "Auto-compiling" not in stderr
+
+    def test_skips_non_write_edit_tools(self, project_dir):
         """Should skip non-Write/Edit tools."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            project_dir = Path(tmpdir) / "project"
-            project_dir.mkdir()
-            (project_dir / "pom.xml").write_text("<project></project>")
-
-            env = {"HOME": tmpdir, "WP_INSTALL_DIR": str(PROJECT_ROOT)}
-            input_data = generate_hook_input(
-                tool_name="Read",
-                file_path=str(project_dir / "src" / "main" / "kotlin" / "Service.kt"),
-                cwd=str(project_dir)
-            )
-
-            exit_code, stdout, stderr = run_hook("wp-auto-compile", input_data, env)
-            assert exit_code == 0
-            assert stdout == ""
-
-    def test_skips_when_wp_phase_4_is_active(self):
+        input_data = generate_hook_input(
+            tool_name="Read",
+            file_path=str(project_dir / "src" / "main" / "kotlin" / "Service.kt"),
+            cwd=str(project_dir)
+        )
+
+        exit_code, stdout, stderr = run_hook("wp-auto-compile", input_data)
+        assert exit_code == 0
+        assert stdout == ""
+
+    def test_skips_when_wp_phase_4_is_active(self, markers_dir, project_dir):
         """Should skip when WP phase 4 is active (auto-test handles it)."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            markers_dir = Path(tmpdir) / ".claude" / "tmp" / "wp-test-session"
-            markers_dir.mkdir(parents=True)
-            setup_wp_state(markers_dir, phase=4)
-
-            project_dir = Path(tmpdir) / "project"
-            project_dir.mkdir()
-            (project_dir / "pom.xml").write_text("<project></project>")
-
-            env = {"HOME": tmpdir, "WP_INSTALL_DIR": str(PROJECT_ROOT)}
-            input_data = generate_hook_input(
-                file_path=str(project_dir / "src" / "main" / "kotlin" / "Service.kt"),
-                cwd=str(project_dir)
-            )
-
-            exit_code, stdout, stderr = run_hook("wp-auto-compile", input_data, env)
-            assert exit_code == 0
-            # Should exit without compile output
-            assert "Auto-compiling" not in stderr
-
-    def test_runs_when_wp_phase_is_not_4(self):
+        setup_wp_state(markers_dir, phase=4)
+
+        input_data = generate_hook_input(
+            file_path=str(project_dir / "src" / "main" / "kotlin" / "Service.kt"),
+            cwd=str(project_dir)
+        )
+
+        exit_code, stdout, stderr = run_hook("wp-auto-compile", input_data)
+        assert exit_code == 0
+        # Should exit without compile output
+        assert "Auto-compiling" not in stderr
+
+    def test_runs_when_wp_phase_is_not_4(self, home_dir, markers_dir, project_dir):
         """Should run compilation when WP phase is not 4."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            markers_dir = Path(tmpdir) / ".claude" / "tmp" / "wp-test-session"
-            markers_dir.mkdir(parents=True)
-            setup_wp_state(markers_dir, phase=2)
-
-            project_dir = Path(tmpdir) / "project"
-            project_dir.mkdir()
-            (project_dir / "pom.xml").write_text("<project></project>")
-
-            setup_mock_compile(tmpdir, success=True)
-
-            env = {
-                "HOME": tmpdir,
-                "WP_INSTALL_DIR": str(PROJECT_ROOT),
-                "TEST_TMP": tmpdir
-            }
-            input_data = generate_hook_input(
-                file_path=str(project_dir / "src" / "main" / "kotlin" / "Service.kt"),
-                cwd=str(project_dir)
-            )
-
-            exit_code, stdout, stderr = run_hook("wp-auto-compile", input_data, env, use_mocks=True)
-            assert exit_code == 0
-            assert "Auto-compiling" in stderr
-
-    def test_runs_when_wp_mode_is_inactive(self):
+        setup_wp_state(markers_dir, phase=2)
+
+        setup_mock_compile(home_dir, success=True)
+
+        input_data = generate_hook_input(
+            file_path=str(project_dir / "src" / "main" / "kotlin" / "Service.kt"),
+            cwd=str(project_dir)
+        )
+
+        exit_code, stdout, stderr = run_hook("wp-auto-compile", input_data, use_mocks=True)
+        assert exit_code == 0
+        assert "Auto-compiling" in stderr
+
+    def test_runs_when_wp_mode_is_inactive(self, home_dir, project_dir):
         """Should run compilation when WP mode is inactive."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            project_dir = Path(tmpdir) / "project"
-            project_dir.mkdir()
-            (project_dir / "pom.xml").write_text("<project></project>")
-
-            setup_mock_compile(tmpdir, success=True)
-
-            env = {
-                "HOME": tmpdir,
-                "WP_INSTALL_DIR": str(PROJECT_ROOT),
-                "TEST_TMP": tmpdir
-            }
-            input_data = generate_hook_input(
-                file_path=str(project_dir / "src" / "main" / "kotlin" / "Service.kt"),
-                cwd=str(project_dir)
-            )
-
-            exit_code, stdout, stderr = run_hook("wp-auto-compile", input_data, env, use_mocks=True)
-            assert exit_code == 0
-            assert "Auto-compiling" in stderr
-
-    def test_typescript_compile_success(self):
+        setup_mock_compile(home_dir, success=True)
+
+        input_data = generate_hook_input(
+            file_path=str(project_dir / "src" / "main" / "kotlin" / "Service.kt"),
+            cwd=str(project_dir)
+        )
+
+        exit_code, stdout, stderr = run_hook("wp-auto-compile", input_data, use_mocks=True)
+        assert exit_code == 0
+        assert "Auto-compiling" in stderr
+
+    def test_typescript_compile_success(self, home_dir, ts_project_dir):
         """Should compile TypeScript project successfully."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            project_dir = Path(tmpdir) / "project"
-            project_dir.mkdir()
-            (project_dir / "package.json").write_text('{"name": "test"}')
-            (project_dir / "tsconfig.json").write_text('{}')
-
-            setup_mock_compile(tmpdir, success=True, output="Build completed successfully")
-
-            env = {
-                "HOME": tmpdir,
-                "WP_INSTALL_DIR": str(PROJECT_ROOT),
-                "TEST_TMP": tmpdir
-            }
-            input_data = generate_hook_input(
-                file_path=str(project_dir / "src" / "service.ts"),
-                cwd=str(project_dir)
-            )
-
-            exit_code, stdout, stderr = run_hook("wp-auto-compile", input_data, env, use_mocks=True)
-            assert exit_code == 0
-            assert "Auto-compiling" in stderr
-
-    def test_typescript_compile_failure(self):
-        """Should handle TypeScript compilation failure."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            project_dir = Path(tmpdir) / "project"
-            project_dir.mkdir()
-            (project_dir / "package.json").write_text('{"name": "test"}')
-            (project_dir / "tsconfig.json").write_text('{}')
+        setup_mock_compile(home_dir, success=True, output="Build completed successfully")
 
-            setup_mock_compile(tmpdir, success=False, output="error TS2304: Cannot find name 'foo'")
+        input_data = generate_hook_input(
+            file_path=str(ts_project_dir / "src" / "service.ts"),
+            cwd=str(ts_project_dir)
+        )
 
-            env = {
-                "HOME": tmpdir,
-                "WP_INSTALL_DIR": str(PROJECT_ROOT),
-                "TEST_TMP": tmpdir
-            }
-            input_data = generate_hook_input(
-                file_path=str(project_dir / "src" / "service.ts"),
-                cwd=str(project_dir)
-            )
+        exit_code, stdout, stderr = run_hook("wp-auto-compile", input_data, use_mocks=True)
+        assert exit_code == 0
+        assert "Auto-compiling" in stderr
+
+    def test_typescript_compile_failure(self, home_dir, ts_project_dir):
+        """Should handle TypeScript compilation failure."""
+        setup_mock_compile(home_dir, success=False, output="error TS2304: Cannot find name 'foo'")
 
-            exit_code, stdout, stderr = run_hook("wp-auto-compile", input_data, env, use_mocks=True)
-            assert exit_code == 0
-            assert "Compilation failed" in stderr
+        input_data = generate_hook_input(
+            file_path=str(ts_project_dir / "src" / "service.ts"),
+            cwd=str(ts_project_dir)
+        )
+
+        exit_code, stdout, stderr = run_hook("wp-auto-compile", input_data, use_mocks=True)
+        assert exit_code == 0
+        assert "Compilation failed" in stderr
 
 
 class TestAutoTestHook:
     """Tests for wp-auto-test.py"""
 
-    def test_skips_when_wp_mode_is_inactive(self):
+    def test_skips_when_wp_mode_is_inactive(self, project_dir):
         """Should skip when WP mode is inactive."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            project_dir = Path(tmpdir) / "project"
-            project_dir.mkdir()
-            (project_dir / "pom.xml").write_text("<project></project>")
-
-            env = {"HOME": tmpdir, "WP_INSTALL_DIR": str(PROJECT_ROOT)}
-            input_data = generate_hook_input(
-                file_path=str(project_dir / "src" / "main" / "kotlin" / "Service.kt"),
-                cwd=str(project_dir)
-            )
-
-            exit_code, stdout, stderr = run_hook("wp-auto-test", input_data, env)
-            assert exit_code == 0
-            assert stdout == ""
-
-    def test_skips_when_not_in_phase_4(self):
+        input_data = generate_hook_input(
+            file_path=str(project_dir / "src" / "main" / "kotlin" / "Service.kt"),
+            cwd=str(project_dir)
+        )
+
+        exit_code, stdout, stderr = run_hook("wp-auto-test", input_data)
+        assert exit_code == 0
+        assert stdout == ""
+
+    def test_skips_when_not_in_phase_4(self, markers_dir, project_dir):
         """Should skip when not in phase 4."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            markers_dir = Path(tmpdir) / ".claude" / "tmp" / "wp-test-session"
-            markers_dir.mkdir(parents=True)
-            setup_wp_state(markers_dir, phase=2)
-
-            project_dir = Path(tmpdir) / "project"
-            project_dir.mkdir()
-            (project_dir / "pom.xml").write_text("<project></project>")
-
-            env = {"HOME": tmpdir, "WP_INSTALL_DIR": str(PROJECT_ROOT)}
-            input_data = generate_hook_input(
-                file_path=str(project_dir / "src" / "main" / "kotlin" / "Service.kt"),
-                cwd=str(project_dir)
-            )
-
-            exit_code, stdout, stderr = run_hook("wp-auto-test", input_data, env)
-            assert exit_code == 0
-            assert stdout == ""
-
-    def test_skips_for_non_write_edit_tools(self):
+        setup_wp_state(markers_dir, phase=2)
+
+        input_data = generate_hook_input(
+            file_path=str(project_dir / "src" / "main" / "kotlin" / "Service.kt"),
+            cwd=str(project_dir)
+        )
+
+        exit_code, stdout, stderr = run_hook("wp-auto-test", input_data)
+        assert exit_code == 0
+        assert stdout == ""
+
+    def test_skips_for_non_write_edit_tools(self, markers_dir, project_dir):
         """Should skip for non-Write/Edit tools."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            markers_dir = Path(tmpdir) / ".claude" / "tmp" / "wp-test-session"
-            markers_dir.mkdir(parents=True)
-            setup_wp_state(markers_dir, phase=4)
-
-            project_dir = Path(tmpdir) / "project"
-            project_dir.mkdir()
-            (project_dir / "pom.xml").write_text("<project></project>")
-
-            env = {"HOME": tmpdir, "WP_INSTALL_DIR": str(PROJECT_ROOT)}
-            input_data = generate_hook_input(
-                tool_name="Read",
-                file_path=str(project_dir / "src" / "main" / "kotlin" / "Service.kt"),
-                cwd=str(project_dir)
-            )
-
-            exit_code, stdout, stderr = run_hook("wp-auto-test", input_data, env)
-            assert exit_code == 0
-            assert stdout == ""
-
-    def test_skips_for_non_source_files(self):
+        setup_wp_state(markers_dir, phase=4)
+
+        input_data = generate_hook_input(
+            tool_name="Read",
+            file_path=str(project_dir / "src" / "main" / "kotlin" / "Service.kt"),
+            cwd=str(project_dir)
+        )
+
+        exit_code, stdout, stderr = run_hook("wp-auto-test", input_data)
+        assert exit_code == 0
+        assert stdout == ""
+
+    def test_skips_for_non_source_files(self, markers_dir, project_dir):
         """Should skip for non-source files."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            markers_dir = Path(tmpdir) / ".claude" / "tmp" / "wp-test-session"
-            markers_dir.mkdir(parents=True)
-            setup_wp_state(markers_dir, phase=4)
-
-            project_dir = Path(tmpdir) / "project"
-            project_dir.mkdir()
-            (project_dir / "pom.xml").write_text("<project></project>")
-
-            env = {"HOME": tmpdir, "WP_INSTALL_DIR": str(PROJECT_ROOT)}
-            input_data = generate_hook_input(
-                file_path=str(project_dir / "README.md"),
-                cwd=str(project_dir)
-            )
-
-            exit_code, stdout, stderr = run_hook("wp-auto-test", input_data, env)
-            assert exit_code == 0
-            assert stdout == ""
-
-    def test_runs_in_phase_4_for_source_files_success(self):
+        setup_wp_state(markers_dir, phase=4)
+
+        input_data = generate_hook_input(
+            file_path=str(project_dir / "README.md"),
+            cwd=str(project_dir)
+        )
+
+        exit_code, stdout, stderr = run_hook("wp-auto-test", input_data)
+        assert exit_code == 0
+        assert stdout == ""
+
+    def test_runs_in_phase_4_for_source_files_success(self, home_dir, markers_dir, project_dir):
         """Should run tests in phase 4 for source file changes - tests pass."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            markers_dir = Path(tmpdir) / ".claude" / "tmp" / "wp-test-session"
-            markers_dir.mkdir(parents=True)
-            setup_wp_state(markers_dir, phase=4)
-
-            project_dir = Path(tmpdir) / "project"
-            project_dir.mkdir()
-            (project_dir / "pom.xml").write_text("<project></project>")
-
-            # Set up mocks for both compile and test to succeed
-            setup_mock_compile(tmpdir, success=True)
-            setup_mock_test(tmpdir, success=True)
-
-            env = {
-                "HOME": tmpdir,
-                "WP_INSTALL_DIR": str(PROJECT_ROOT),
-                "TEST_TMP": tmpdir
-            }
-            input_data = generate_hook_input(
-                file_path=str(project_dir / "src" / "main" / "kotlin" / "Service.kt"),
-                cwd=str(project_dir)
-            )
-
-            exit_code, stdout, stderr = run_hook("wp-auto-test", input_data, env, use_mocks=True)
-            assert exit_code == 0
-            assert "Running compile + test cycle" in stderr
-            assert "All tests passing" in stderr
-
-    def test_runs_in_phase_4_for_source_files_test_failure(self):
+        setup_wp_state(markers_dir, phase=4)
+
+        # Set up mocks for both compile and test to succeed
+        setup_mock_compile(home_dir, success=True)
+        setup_mock_test(home_dir, success=True)
+
+        input_data = generate_hook_input(
+            file_path=str(project_dir / "src" / "main" / "kotlin" / "Service.kt"),
+            cwd=str(project_dir)
+        )
+
+        exit_code, stdout, stderr = run_hook("wp-auto-test", input_data, use_mocks=True)
+        assert exit_code == 0
+        assert "Running compile + test cycle" in stderr
+        assert "All tests passing" in stderr
+
+    def test_runs_in_phase_4_for_source_files_test_failure(self, home_dir, markers_dir, project_dir):
         """Should handle test failures in phase 4."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            markers_dir = Path(tmpdir) / ".claude" / "tmp" / "wp-test-session"
-            markers_dir.mkdir(parents=True)
-            setup_wp_state(markers_dir, phase=4)
-
-            project_dir = Path(tmpdir) / "project"
-            project_dir.mkdir()
-            (project_dir / "pom.xml").write_text("<project></project>")
-
-            # Set up compile to succeed but tests to fail
-            setup_mock_compile(tmpdir, success=True)
-            setup_mock_test(tmpdir, success=False, output="Tests run: 5, Failures: 2\nFailed: testService")
-
-            env = {
-                "HOME": tmpdir,
-                "WP_INSTALL_DIR": str(PROJECT_ROOT),
-                "TEST_TMP": tmpdir
-            }
-            input_data = generate_hook_input(
-                file_path=str(project_dir / "src" / "main" / "kotlin" / "Service.kt"),
-                cwd=str(project_dir)
-            )
-
-            exit_code, stdout, stderr = run_hook("wp-auto-test", input_data, env, use_mocks=True)
-            assert exit_code == 0
-            # Should indicate test failure
-            assert "fail" in stderr.lower() or "fail" in stdout.lower()
-
-    def test_runs_in_phase_4_compile_failure(self):
+        setup_wp_state(markers_dir, phase=4)
+
+        # Set up compile to succeed but tests to fail
+        setup_mock_compile(home_dir, success=True)
+        setup_mock_test(home_dir, success=False, output="Tests run: 5, Failures: 2\nFailed: testService")
+
+        input_data = generate_hook_input(
+            file_path=str(project_dir / "src" / "main" / "kotlin" / "Service.kt"),
+            cwd=str(project_dir)
+        )
+
+        exit_code, stdout, stderr = run_hook("wp-auto-test", input_data, use_mocks=True)
+        assert exit_code == 0
+        # Should indicate test failure
+        assert "fail" in stderr.lower() or "fail" in stdout.lower()
+
+    def test_runs_in_phase_4_compile_failure(self, home_dir, markers_dir, project_dir):
         """Should handle compile failures in phase 4."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            markers_dir = Path(tmpdir) / ".claude" / "tmp" / "wp-test-session"
-            markers_dir.mkdir(parents=True)
-            setup_wp_state(markers_dir, phase=4)
-
-            project_dir = Path(tmpdir) / "project"
-            project_dir.mkdir()
-            (project_dir / "pom.xml").write_text("<project></project>")
-
-            # Set up compile to fail
-            setup_mock_compile(tmpdir, success=False, output="[ERROR] Compilation failed")
-
-            env = {
-                "HOME": tmpdir,
-                "WP_INSTALL_DIR": str(PROJECT_ROOT),
-                "TEST_TMP": tmpdir
-            }
-            input_data = generate_hook_input(
-                file_path=str(project_dir / "src" / "main" / "kotlin" / "Service.kt"),
-                cwd=str(project_dir)
-            )
-
-            exit_code, stdout, stderr = run_hook("wp-auto-test", input_data, env, use_mocks=True)
-            assert exit_code == 0
-            # Should indicate compile failure - tests shouldn't run
-            assert "compil" in stderr.lower() or "compil" in stdout.lower()
-
-    def test_runs_for_test_file_changes(self):
+        setup_wp_state(markers_dir, phase=4)
+
+        # Set up compile to fail
+        setup_mock_compile(home_dir, success=False, output="[ERROR] Compilation failed")
+
+        input_data = generate_hook_input(
+            file_path=str(project_dir / "src" / "main" / "kotlin" / "Service.kt"),
+            cwd=str(project_dir)
+        )
+
+        exit_code, stdout, stderr = run_hook("wp-auto-test", input_data, use_mocks=True)
+        assert exit_code == 0
+        # Should indicate compile failure - tests shouldn't run
+        assert "compil" in stderr.lower() or "compil" in stdout.lower()
+
+    def test_runs_for_test_file_changes(self, home_dir, markers_dir, project_dir):
         """Should run for test file changes in phase 4."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            markers_dir = Path(tmpdir) / ".claude" / "tmp" / "wp-test-session"
-            markers_dir.mkdir(parents=True)
-            setup_wp_state(markers_dir, phase=4)
-
-            project_dir = Path(tmpdir) / "project"
-            project_dir.mkdir()
-            (project_dir / "pom.xml").write_text("<project></project>")
-
-            setup_mock_compile(tmpdir, success=True)
-            setup_mock_test(tmpdir, success=True)
-
-            env = {
-                "HOME": tmpdir,
-                "WP_INSTALL_DIR": str(PROJECT_ROOT),
-                "TEST_TMP": tmpdir
-            }
-            input_data = generate_hook_input(
-                file_path=str(project_dir / "src" / "test" / "kotlin" / "ServiceTest.kt"),
-                cwd=str(project_dir)
-            )
-
-            exit_code, stdout, stderr = run_hook("wp-auto-test", input_data, env, use_mocks=True)
-            assert exit_code == 0
-
-    def test_outputs_approve_with_context_on_test_failure(self):
+        setup_wp_state(markers_dir, phase=4)
+
+        setup_mock_compile(home_dir, success=True)
+        setup_mock_test(home_dir, success=True)
+
+        input_data = generate_hook_input(
+            file_path=str(project_dir / "src" / "test" / "kotlin" / "ServiceTest.kt"),
+            cwd=str(project_dir)
+        )
+
+        exit_code, stdout, stderr = run_hook("wp-auto-test", input_data, use_mocks=True)
+        assert exit_code == 0
+
+    def test_outputs_approve_with_context_on_test_failure(self, home_dir, markers_dir, project_dir):
         """Should output approve decision with error context when tests fail."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            markers_dir = Path(tmpdir) / ".claude" / "tmp" / "wp-test-session"
-            markers_dir.mkdir(parents=True)
-            setup_wp_state(markers_dir, phase=4)
-
-            project_dir = Path(tmpdir) / "project"
-            project_dir.mkdir()
-            (project_dir / "pom.xml").write_text("<project></project>")
-
-            setup_mock_compile(tmpdir, success=True)
-            setup_mock_test(tmpdir, success=False, output="Tests run: 3, Failures: 1\nFailed: testSomething")
-
-            env = {
-                "HOME": tmpdir,
-                "WP_INSTALL_DIR": str(PROJECT_ROOT),
-                "TEST_TMP": tmpdir
-            }
-            input_data = generate_hook_input(
-                file_path=str(project_dir / "src" / "main" / "kotlin" / "Service.kt"),
-                cwd=str(project_dir)
-            )
-
-            exit_code, stdout, stderr = run_hook("wp-auto-test", input_data, env, use_mocks=True)
-            assert exit_code == 0
-            # Should output approve with context
-            if stdout:
-                response = json.loads(stdout)
-                assert response.get("decision") == "approve"
-                assert "Tests failing" in response.get("reason", "")
-
-    def test_typescript_test_cycle(self):
+        setup_wp_state(markers_dir, phase=4)
+
+        setup_mock_compile(home_dir, success=True)
+        setup_mock_test(home_dir, success=False, output="Tests run: 3, Failures: 1\nFailed: testSomething")
+
+        input_data = generate_hook_input(
+            file_path=str(project_dir / "src" / "main" / "kotlin" / "Service.kt"),
+            cwd=str(project_dir)
+        )
+
+        exit_code, stdout, stderr = run_hook("wp-auto-test", input_data, use_mocks=True)
+        assert exit_code == 0
+        # Should output approve with context
+        if stdout:
+            response = _loads(stdout)
+            assert response.get("decision") == "approve"
+            assert "Tests failing" in response.get("reason", "")
+
+    def test_typescript_test_cycle(self, home_dir, markers_dir, ts_project_dir):
         """Should run compile + test cycle for TypeScript projects."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            markers_dir = Path(tmpdir) / ".claude" / "tmp" / "wp-test-session"
-            markers_dir.mkdir(parents=True)
-            setup_wp_state(markers_dir, phase=4)
-
-            project_dir = Path(tmpdir) / "project"
-            project_dir.mkdir()
-            (project_dir / "package.json").write_text('{"name": "test"}')
-            (project_dir / "tsconfig.json").write_text('{}')
-
-            setup_mock_compile(tmpdir, success=True)
-            setup_mock_test(tmpdir, success=True)
-
-            env = {
-                "HOME": tmpdir,
-                "WP_INSTALL_DIR": str(PROJECT_ROOT),
-                "TEST_TMP": tmpdir
-            }
-            input_data = generate_hook_input(
-                file_path=str(project_dir / "src" / "service.ts"),
-                cwd=str(project_dir)
-            )
-
-            exit_code, stdout, stderr = run_hook("wp-auto-test", input_data, env, use_mocks=True)
-            assert exit_code == 0
-            assert "Running compile + test cycle" in stderr
+        setup_wp_state(markers_dir, phase=4)
+
+        setup_mock_compile(home_dir, success=True)
+        setup_mock_test(home_dir, success=True)
+
+        input_data = generate_hook_input(
+            file_path=str(ts_project_dir / "src" / "service.ts"),
+            cwd=str(ts_project_dir)
+        )
+
+        exit_code, stdout, stderr = run_hook("wp-auto-test", input_data, use_mocks=True)
+        assert exit_code == 0
+        assert "Running compile + test cycle" in stderr
 
 
 class TestOrchestratorHook:
@@ -1168,177 +882,119 @@ class TestOrchestratorHook:
     Phase transitions and agent loading are handled by wp-activation.py.
     """
 
-    def test_exits_silently_when_wp_inactive(self):
+    def test_exits_silently_when_wp_inactive(self, project_dir):
         """Should exit silently when WP mode is inactive."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            project_dir = Path(tmpdir) / "project"
-            project_dir.mkdir()
+        input_data = generate_hook_input(
+            cwd=str(project_dir),
+            hook_event_name="Stop"
+        )
 
-            env = {"HOME": tmpdir, "WP_INSTALL_DIR": str(PROJECT_ROOT)}
-            input_data = generate_hook_input(
-                cwd=str(project_dir),
-                hook_event_name="Stop"
-            )
-
-            exit_code, stdout, stderr = run_hook("wp-orchestrator", input_data, env)
-            assert exit_code == 0
-            assert stdout == ""
+        exit_code, stdout, stderr = run_hook("wp-orchestrator", input_data)
+        assert exit_code == 0
+        assert stdout == ""
 
-    def test_exits_when_stop_hook_active(self):
+    def test_exits_when_stop_hook_active(self, markers_dir, project_dir):
         """Should exit when stop_hook_active is true to prevent loops."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            markers_dir = Path(tmpdir) / ".claude" / "tmp" / "wp-test-session"
-            markers_dir.mkdir(parents=True)
-            setup_wp_state(markers_dir, phase=2)
-
-            project_dir = Path(tmpdir) / "project"
-            project_dir.mkdir()
-
-            env = {"HOME": tmpdir, "WP_INSTALL_DIR": str(PROJECT_ROOT)}
-            input_data = generate_hook_input(
-                cwd=str(project_dir),
-                hook_event_name="Stop",
-                stop_hook_active=True
-            )
-
-            exit_code, stdout, stderr = run_hook("wp-orchestrator", input_data, env)
-            assert exit_code == 0
-            assert stdout == ""
-
-    def test_phase_1_silent(self):
+        setup_wp_state(markers_dir, phase=2)
+
+        input_data = generate_hook_input(
+            cwd=str(project_dir),
+            hook_event_name="Stop",
+            stop_hook_active=True
+        )
+
+        exit_code, stdout, stderr = run_hook("wp-orchestrator", input_data)
+        assert exit_code == 0
+        assert stdout == ""
+
+    def test_phase_1_silent(self, markers_dir, project_dir):
         """Should return silently in phase 1 (no build verification needed)."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            markers_dir = Path(tmpdir) / ".claude" / "tmp" / "wp-test-session"
-            markers_dir.mkdir(parents=True)
-            setup_wp_state(markers_dir, phase=1)
-
-            project_dir = Path(tmpdir) / "project"
-            project_dir.mkdir()
-            (project_dir / "pom.xml").write_text("<project></project>")
-
-            env = {"HOME": tmpdir, "WP_INSTALL_DIR": str(PROJECT_ROOT)}
-            input_data = generate_hook_input(
-                cwd=str(project_dir),
-                hook_event_name="Stop"
-            )
-
-            exit_code, stdout, stderr = run_hook("wp-orchestrator", input_data, env)
-            assert exit_code == 0
-            assert stdout == ""
-
-    def test_phase_2_blocks_on_compile_failure(self):
+        setup_wp_state(markers_dir, phase=1)
+
+        input_data = generate_hook_input(
+            cwd=str(project_dir),
+            hook_event_name="Stop"
+        )
+
+        exit_code, stdout, stderr = run_hook("wp-orchestrator", input_data)
+        assert exit_code == 0
+        assert stdout == ""
+
+    def test_phase_2_blocks_on_compile_failure(self, markers_dir, project_dir):
         """Should block in phase 2 when compile fails."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            markers_dir = Path(tmpdir) / ".claude" / "tmp" / "wp-test-session"
-            markers_dir.mkdir(parents=True)
-            setup_wp_state(markers_dir, phase=2)
-
-            project_dir = Path(tmpdir) / "project"
-            project_dir.mkdir()
-            # Minimal pom.xml will cause compile to fail
-            (project_dir / "pom.xml").write_text("<project></project>")
-
-            env = {"HOME": tmpdir, "WP_INSTALL_DIR": str(PROJECT_ROOT)}
-            input_data = generate_hook_input(
-                cwd=str(project_dir),
-                hook_event_name="Stop"
-            )
-
-            exit_code, stdout, stderr = run_hook("wp-orchestrator", input_data, env)
-            assert exit_code == 0
-            # Should block with compile error
-            if stdout:
-                response = json.loads(stdout)
-                assert response.get("decision") == "block"
-                assert "Compilation FAILED" in response.get("reason", "")
-
-    def test_phase_3_blocks_on_test_compile_failure(self):
+        setup_wp_state(markers_dir, phase=2)
+
+        # project_dir only has a minimal pom.xml, so compile fails
+        input_data = generate_hook_input(
+            cwd=str(project_dir),
+            hook_event_name="Stop"
+        )
+
+        exit_code, stdout, stderr = run_hook("wp-orchestrator", input_data)
+        assert exit_code == 0
+        # Should block with compile error
+        if stdout:
+            response = _loads(stdout)
+            assert response.get("decision") == "block"
+            assert "Compilation FAILED" in response.get("reason", "")
+
+    def test_phase_3_blocks_on_test_compile_failure(self, markers_dir, project_dir):
         """Should block in phase 3 when test compile fails."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            markers_dir = Path(tmpdir) / ".claude" / "tmp" / "wp-test-session"
-            markers_dir.mkdir(parents=True)
-            setup_wp_state(markers_dir, phase=3)
-
-            project_dir = Path(tmpdir) / "project"
-            project_dir.mkdir()
-            # Minimal pom.xml will cause compile to fail
-            (project_dir / "pom.xml").write_text("<project></project>")
-
-            env = {"HOME": tmpdir, "WP_INSTALL_DIR": str(PROJECT_ROOT)}
-            input_data = generate_hook_input(
-                cwd=str(project_dir),
-                hook_event_name="Stop"
-            )
-
-            exit_code, stdout, stderr = run_hook("wp-orchestrator", input_data, env)
-            assert exit_code == 0
-            # Should block with compile error
-            if stdout:
-                response = json.loads(stdout)
-                assert response.get("decision") == "block"
-                assert "Compilation FAILED" in response.get("reason", "")
-
-    def test_phase_4_completes_workflow_when_tests_pass(self):
+        setup_wp_state(markers_dir, phase=3)
+
+        # project_dir only has a minimal pom.xml, so compile fails
+        input_data = generate_hook_input(
+            cwd=str(project_dir),
+            hook_event_name="Stop"
+        )
+
+        exit_code, stdout, stderr = run_hook("wp-orchestrator", input_data)
+        assert exit_code == 0
+        # Should block with compile error
+        if stdout:
+            response = _loads(stdout)
+            assert response.get("decision") == "block"
+            assert "Compilation FAILED" in response.get("reason", "")
+
+    def test_phase_4_completes_workflow_when_tests_pass(self, markers_dir, project_dir):
         """Should complete workflow in phase 4 when compile and tests pass."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            markers_dir = Path(tmpdir) / ".claude" / "tmp" / "wp-test-session"
-            markers_dir.mkdir(parents=True)
-            setup_wp_state(markers_dir, phase=4)
-
-            project_dir = Path(tmpdir) / "project"
-            project_dir.mkdir()
-            (project_dir / "pom.xml").write_text("<project></project>")
-
-            env = {"HOME": tmpdir, "WP_INSTALL_DIR": str(PROJECT_ROOT)}
-            input_data = generate_hook_input(
-                cwd=str(project_dir),
-                hook_event_name="Stop"
-            )
-
-            exit_code, stdout, stderr = run_hook("wp-orchestrator", input_data, env)
-            assert exit_code == 0
-            # Should complete workflow (cleanup markers)
-            # The actual behavior depends on mock compile/test commands
-
-    def test_runs_in_supervisor_mode(self):
+        setup_wp_state(markers_dir, phase=4)
+
+        input_data = generate_hook_input(
+            cwd=str(project_dir),
+            hook_event_name="Stop"
+        )
+
+        exit_code, stdout, stderr = run_hook("wp-orchestrator", input_data)
+        assert exit_code == 0
+        # Should complete workflow (cleanup markers)
+        # The actual behavior depends on mock compile/test commands
+
+    def test_runs_in_supervisor_mode(self, monkeypatch, markers_dir, project_dir):
         """Should run build verification in supervisor mode (no longer skipped)."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            markers_dir = Path(tmpdir) / ".claude" / "tmp" / "wp-test-session"
-            markers_dir.mkdir(parents=True)
-            setup_wp_state(markers_dir, phase=2)
-
-            project_dir = Path(tmpdir) / "project"
-            project_dir.mkdir()
-            # Minimal pom.xml will cause compile to fail
-            (project_dir / "pom.xml").write_text("<project></project>")
-
-            # Set supervisor mode via environment variable
-            env = {
-                "HOME": tmpdir,
-                "WP_INSTALL_DIR": str(PROJECT_ROOT),
-                "WP_SUPERVISOR_ACTIVE": "1"
-            }
-            input_data = generate_hook_input(
-                cwd=str(project_dir),
-                hook_event_name="Stop"
-            )
-
-            exit_code, stdout, stderr = run_hook("wp-orchestrator", input_data, env)
-            assert exit_code == 0
-            # Should block with compile error (proving it ran in supervisor mode)
-            if stdout:
-                response = json.loads(stdout)
-                assert response.get("decision") == "block"
-                assert "Compilation FAILED" in response.get("reason", "")
+        setup_wp_state(markers_dir, phase=2)
+
+        # project_dir only has a minimal pom.xml, so compile fails.
+        # Set supervisor mode via environment variable
+        monkeypatch.setenv("WP_SUPERVISOR_ACTIVE", "1")
+        input_data = generate_hook_input(
+            cwd=str(project_dir),
+            hook_event_name="Stop"
+        )
+
+        exit_code, stdout, stderr = run_hook("wp-orchestrator", input_data)
+        assert exit_code == 0
+        # Should block with compile error (proving it ran in supervisor mode)
+        if stdout:
+            response = _loads(stdout)
+            assert response.get("decision") == "block"
+            assert "Compilation FAILED" in response.get("reason", "")
 
 
 class TestHookIO:
     """Tests for hook_io.py HookInput class."""
 
     def test_hook_input_from_dict(self):
-        sys.path.insert(0, str(PROJECT_ROOT / "hooks" / "lib"))
-        from hook_io import HookInput
-
         data = {
             "tool_name": "Write",
             "tool_input": {"file_path": "/test/path.py"},
@@ -1358,9 +1014,6 @@ class TestHookIO:
         assert hook.hook_event_name == "PreToolUse"
 
     def test_hook_input_handles_missing_fields(self):
-        sys.path.insert(0, str(PROJECT_ROOT / "hooks" / "lib"))
-        from hook_io import HookInput
-
         hook = HookInput.from_dict({})
 
         assert hook.tool_name == ""
@@ -3,15 +3,13 @@
 Unit tests for markers.py - MarkerManager class
 """
 
+import json
 import os
-import sys
 import tempfile
 import pytest
 from pathlib import Path
 from unittest.mock import patch
 
-# Add hooks/lib to path
-sys.path.insert(0, 'hooks/lib')
 from markers import MarkerManager
 
 
@@ -65,6 +63,89 @@ class TestMarkerManager:
                 assert manager.phase_exists() is True
 
 
+class TestSnapshot:
+    """Tests for MarkerManager.snapshot()."""
+
+    def test_snapshot_defaults_when_not_initialized(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with patch.object(Path, 'home', return_value=Path(tmpdir)):
+                snap = MarkerManager("test-session").snapshot()
+                assert snap.wp_active is False
+                assert snap.phase == 1
+                assert snap.impl_complete is False
+
+    def test_snapshot_reflects_state(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with patch.object(Path, 'home', return_value=Path(tmpdir)):
+                manager = MarkerManager("test-session")
+                manager._state.initialize()
+                manager.set_phase(4)
+                manager.mark_implementation_complete()
+                snap = manager.snapshot()
+                assert snap.wp_active is True
+                assert snap.phase == 4
+                assert snap.impl_complete is True
+
+    @pytest.mark.parametrize("stored_phase", [0, 7])
+    def test_snapshot_phase_matches_get_phase_when_out_of_range(self, stored_phase):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with patch.object(Path, 'home', return_value=Path(tmpdir)):
+                manager = MarkerManager("test-session")
+                manager._state.initialize()
+                state_file = MarkerManager.state_file_path("test-session")
+                data = json.loads(state_file.read_text())
+                data["phase"] = stored_phase
+                state_file.write_text(json.dumps(data))
+
+                assert manager.snapshot().phase == manager.get_phase() == 1
+
+    def test_snapshot_is_frozen(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with patch.object(Path, 'home', return_value=Path(tmpdir)):
+                snap = MarkerManager("test-session").snapshot()
+                with pytest.raises(Exception):
+                    snap.phase = 2
+
+
+class TestStateFilePath:
+    """Tests for MarkerManager.state_file_path()."""
+
+    def test_points_at_session_state_file(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with patch.object(Path, 'home', return_value=Path(tmpdir)):
+                with patch.dict(os.environ, {}, clear=False):
+                    os.environ.pop("WP_SUPERVISOR_MARKERS_DIR", None)
+                    os.environ.pop("CLAUDE_CONFIG_DIR", None)
+                    path = MarkerManager.state_file_path("test-session")
+                    assert path == Path(tmpdir) / ".claude" / "tmp" / "wp-test-session" / "state.json"
+
+    def test_does_not_create_directory(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with patch.object(Path, 'home', return_value=Path(tmpdir)):
+                MarkerManager.state_file_path("test-session")
+                assert not (Path(tmpdir) / ".claude" / "tmp" / "wp-test-session").exists()
+
+    def test_matches_manager_state_file(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with patch.object(Path, 'home', return_value=Path(tmpdir)):
+                manager = MarkerManager("test-session")
+                manager._state.initialize()
+                assert MarkerManager.state_file_path("test-session").exists()
+
+    def test_uses_supervisor_markers_dir(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with patch.dict(os.environ, {"WP_SUPERVISOR_MARKERS_DIR": tmpdir}):
+                assert MarkerManager.state_file_path("any") == Path(tmpdir) / "state.json"
+
+    def test_config_dir_skips_home_lookup(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with patch.dict(os.environ, {"CLAUDE_CONFIG_DIR": tmpdir}):
+                os.environ.pop("WP_SUPERVISOR_MARKERS_DIR", None)
+                with patch.object(Path, 'home', side_effect=AssertionError("home looked up")):
+                    path = MarkerManager.state_file_path("test-session")
+                assert path == Path(tmpdir) / "tmp" / "wp-test-session" / "state.json"
+
+
 class TestPhaseCompletion:
     """Tests for phase completion methods."""
 
@@ -3,11 +3,8 @@
 Unit tests for pattern_matcher.py
 """
 
-import sys
 import pytest
 
-# Add hooks/lib to path
-sys.path.insert(0, 'hooks/lib')
 from pattern_matcher import glob_to_regex, matches_pattern, matches_any
 
 
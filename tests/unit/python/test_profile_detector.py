@@ -4,228 +4,196 @@ Unit tests for profile_detector.py
 """
 
 import json
-import sys
-import tempfile
 import pytest
 from pathlib import Path
 
-# Add hooks/lib to path
-sys.path.insert(0, 'hooks/lib')
 from profile_detector import get_override, detect_profile
 
 
+def write_config(tmp_path: Path, data) -> str:
+    """Write data (a dict, or raw text) to tmp_path/config.json and return its path."""
+    config = tmp_path / "config.json"
+    config.write_text(data if isinstance(data, str) else json.dumps(data, separators=(",", ":")))
+    return str(config)
+
+
+@pytest.fixture
+def project_dir(tmp_path):
+    """Empty project directory, separate from the config file."""
+    project = tmp_path / "project"
+    project.mkdir()
+    return project
+
+
 class TestGetOverride:
     """Tests for get_override function."""
 
-    def test_reads_active_profile(self):
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            json.dump({"activeProfile": "kotlin-maven"}, f)
-            f.flush()
-            result = get_override(f.name)
-            assert result == "kotlin-maven"
-
-    def test_returns_empty_for_missing_profile(self):
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            json.dump({"otherKey": "value"}, f)
-            f.flush()
-            result = get_override(f.name)
-            assert result == ""
-
-    def test_returns_empty_for_null_profile(self):
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            json.dump({"activeProfile": None}, f)
-            f.flush()
-            result = get_override(f.name)
-            assert result == ""
-
-    def test_returns_empty_for_empty_string_profile(self):
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            json.dump({"activeProfile": ""}, f)
-            f.flush()
-            result = get_override(f.name)
-            assert result == ""
+    def test_reads_active_profile(self, tmp_path):
+        result = get_override(write_config(tmp_path, {"activeProfile": "kotlin-maven"}))
+        assert result == "kotlin-maven"
+
+    def test_returns_empty_for_missing_profile(self, tmp_path):
+        result = get_override(write_config(tmp_path, {"otherKey": "value"}))
+        assert result == ""
+
+    def test_returns_empty_for_null_profile(self, tmp_path):
+        result = get_override(write_config(tmp_path, {"activeProfile": None}))
+        assert result == ""
+
+    def test_returns_empty_for_empty_string_profile(self, tmp_path):
+        result = get_override(write_config(tmp_path, {"activeProfile": ""}))
+        assert result == ""
 
     def test_returns_empty_for_missing_file(self):
         result = get_override("/nonexistent/file.json")
         assert result == ""
 
-    def test_returns_empty_for_invalid_json(self):
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            f.write("not valid json {")
-            f.flush()
-            result = get_override(f.name)
-            assert result == ""
+    def test_returns_empty_for_invalid_json(self, tmp_path):
+        result = get_override(write_config(tmp_path, "not valid json {"))
+        assert result == ""
 
 
 class TestDetectProfile:
     """Tests for detect_profile function."""
 
-    def test_detects_based_on_files(self):
-        with tempfile.TemporaryDirectory() as project_dir:
-            # Create detection file
-            Path(project_dir, "package.json").touch()
-
-            # Create config file
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-                json.dump({
-                    "profiles": {
-                        "typescript-npm": {
-                            "detection": {
-                                "files": ["package.json"],
-                                "patterns": []
-                            }
-                        }
+    def test_detects_based_on_files(self, tmp_path, project_dir):
+        # Create detection file
+        (project_dir / "package.json").touch()
+
+        config = write_config(tmp_path, {
+            "profiles": {
+                "typescript-npm": {
+                    "detection": {
+                        "files": ["package.json"],
+                        "patterns": []
                     }
-                }, f)
-                f.flush()
-                result = detect_profile(project_dir, f.name)
-                assert result == "typescript-npm"
-
-    def test_detects_based_on_patterns(self):
-        with tempfile.TemporaryDirectory() as project_dir:
-            # Create source file matching pattern
-            src_dir = Path(project_dir, "src")
-            src_dir.mkdir()
-            (src_dir / "main.py").touch()
-
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-                json.dump({
-                    "profiles": {
-                        "python-pytest": {
-                            "detection": {
-                                "files": [],
-                                "patterns": ["*.py"]
-                            }
-                        }
+                }
+            }
+        })
+        result = detect_profile(str(project_dir), config)
+        assert result == "typescript-npm"
+
+    def test_detects_based_on_patterns(self, tmp_path, project_dir):
+        # Create source file matching pattern
+        src_dir = project_dir / "src"
+        src_dir.mkdir()
+        (src_dir / "main.py").touch()
+
+        config = write_config(tmp_path, {
+            "profiles": {
+                "python-pytest": {
+                    "detection": {
+                        "files": [],
+                        "patterns": ["*.py"]
                     }
-                }, f)
-                f.flush()
-                result = detect_profile(project_dir, f.name)
-                assert result == "python-pytest"
-
-    def test_returns_highest_scoring_profile(self):
-        with tempfile.TemporaryDirectory() as project_dir:
-            # Create files that match both profiles
-            Path(project_dir, "package.json").touch()
-            Path(project_dir, "pom.xml").touch()
-            Path(project_dir, "build.gradle").touch()  # Extra point for kotlin
-
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-                json.dump({
-                    "profiles": {
-                        "typescript-npm": {
-                            "detection": {
-                                "files": ["package.json"],
-                                "patterns": []
-                            }
-                        },
-                        "kotlin-maven": {
-                            "detection": {
-                                "files": ["pom.xml", "build.gradle"],
-                                "patterns": []
-                            }
-                        }
+                }
+            }
+        })
+        result = detect_profile(str(project_dir), config)
+        assert result == "python-pytest"
+
+    def test_returns_highest_scoring_profile(self, tmp_path, project_dir):
+        # Create files that match both profiles
+        (project_dir / "package.json").touch()
+        (project_dir / "pom.xml").touch()
+        (project_dir / "build.gradle").touch()  # Extra point for kotlin
+
+        config = write_config(tmp_path, {
+            "profiles": {
+                "typescript-npm": {
+                    "detection": {
+                        "files": ["package.json"],
+                        "patterns": []
                     }
-                }, f)
-                f.flush()
-                result = detect_profile(project_dir, f.name)
-                # Kotlin should win with 2 files (20 points) vs TypeScript 1 file (10 points)
-                assert result == "kotlin-maven"
-
-    def test_returns_empty_for_no_match(self):
-        with tempfile.TemporaryDirectory() as project_dir:
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-                json.dump({
-                    "profiles": {
-                        "typescript-npm": {
-                            "detection": {
-                                "files": ["package.json"],
-                                "patterns": []
-                            }
-                        }
+                },
+                "kotlin-maven": {
+                    "detection": {
+                        "files": ["pom.xml", "build.gradle"],
+                        "patterns": []
                     }
-                }, f)
-                f.flush()
-                result = detect_profile(project_dir, f.name)
-                assert result == ""
-
-    def test_returns_empty_for_missing_config(self):
-        with tempfile.TemporaryDirectory() as project_dir:
-            result = detect_profile(project_dir, "/nonexistent/config.json")
-            assert result == ""
-
-    def test_returns_empty_for_invalid_config(self):
-        with tempfile.TemporaryDirectory() as project_dir:
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-                f.write("invalid json")
-                f.flush()
-                result = detect_profile(project_dir, f.name)
-                assert result == ""
-
-    def test_returns_empty_when_pattern_only_scores_are_tied(self):
-        with tempfile.TemporaryDirectory() as project_dir:
-            # Create source files matching two different profiles (no detection files)
-            src_dir = Path(project_dir, "src")
-            src_dir.mkdir()
-            (src_dir / "Main.kt").touch()
-            (src_dir / "app.py").touch()
-
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-                json.dump({
-                    "profiles": {
-                        "kotlin-maven": {
-                            "detection": {
-                                "files": ["pom.xml"],
-                                "patterns": ["**/*.kt"]
-                            }
-                        },
-                        "python-pytest": {
-                            "detection": {
-                                "files": ["requirements.txt"],
-                                "patterns": ["**/*.py"]
-                            }
-                        }
+                }
+            }
+        })
+        result = detect_profile(str(project_dir), config)
+        # Kotlin should win with 2 files (20 points) vs TypeScript 1 file (10 points)
+        assert result == "kotlin-maven"
+
+    def test_returns_empty_for_no_match(self, tmp_path, project_dir):
+        config = write_config(tmp_path, {
+            "profiles": {
+                "typescript-npm": {
+                    "detection": {
+                        "files": ["package.json"],
+                        "patterns": []
                     }
-                }, f)
-                f.flush()
-                result = detect_profile(project_dir, f.name)
-                assert result == ""
-
-    def test_returns_profile_when_pattern_only_score_is_unique(self):
-        with tempfile.TemporaryDirectory() as project_dir:
-            # Only Python files exist, no detection files
-            src_dir = Path(project_dir, "src")
-            src_dir.mkdir()
-            (src_dir / "app.py").touch()
-
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-                json.dump({
-                    "profiles": {
-                        "kotlin-maven": {
-                            "detection": {
-                                "files": ["pom.xml"],
-                                "patterns": ["**/*.kt"]
-                            }
-                        },
-                        "python-pytest": {
-                            "detection": {
-                                "files": ["requirements.txt"],
-                                "patterns": ["**/*.py"]
-                            }
-                        }
+                }
+            }
+        })
+        result = detect_profile(str(project_dir), config)
+        assert result == ""
+
+    def test_returns_empty_for_missing_config(self, project_dir):
+        result = detect_profile(str(project_dir), "/nonexistent/config.json")
+        assert result == ""
+
+    def test_returns_empty_for_invalid_config(self, tmp_path, project_dir):
+        result = detect_profile(str(project_dir), write_config(tmp_path, "invalid json"))
+        assert result == ""
+
+    def test_returns_empty_when_pattern_only_scores_are_tied(self, tmp_path, project_dir):
+        # Create source files matching two different profiles (no detection files)
+        src_dir = project_dir / "src"
+        src_dir.mkdir()
+        (src_dir / "Main.kt").touch()
+        (src_dir / "app.py").touch()
+
+        config = write_config(tmp_path, {
+            "profiles": {
+                "kotlin-maven": {
+                    "detection": {
+                        "files": ["pom.xml"],
+                        "patterns": ["**/*.kt"]
                     }
-                }, f)
-                f.flush()
-                result = detect_profile(project_dir, f.name)
-                assert result == "python-pytest"
-
-    def test_handles_empty_profiles(self):
-        with tempfile.TemporaryDirectory() as project_dir:
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-                json.dump({"profiles": {}}, f)
-                f.flush()
-                result = detect_profile(project_dir, f.name)
-                assert result == ""
+                },
+                "python-pytest": {
+                    "detection": {
+                        "files": ["requirements.txt"],
+                        "patterns": ["**/*.py"]
+                    }
+                }
+            }
+        })
+        result = detect_profile(str(project_dir), config)
+        assert result == ""
+
+    def test_returns_profile_when_pattern_only_score_is_unique(self, tmp_path, project_dir):
+        # Only Python files exist, no detection files
+        src_dir = project_dir / "src"
+        src_dir.mkdir()
+        (src_dir / "app.py").touch()
+
+        config = write_config(tmp_path, {
+            "profiles": {
+                "kotlin-maven": {
+                    "detection": {
+                        "files": ["pom.xml"],
+                        "patterns": ["**/*.kt"]
+                    }
+                },
+                "python-pytest": {
+                    "detection": {
+                        "files": ["requirements.txt"],
+                        "patterns": ["**/*.py"]
+                    }
+                }
+            }
+        })
+        result = detect_profile(str(project_dir), config)
+        assert result == "python-pytest"
+
+    def test_handles_empty_profiles(self, tmp_path, project_dir):
+        result = detect_profile(str(project_dir), write_config(tmp_path, {"profiles": {}}))
+        assert result == ""
 
 
 if __name__ == '__main__':
@@ -74,9 +74,6 @@ mock_sdk.types = mock_types
 sys.modules['claude_agent_sdk'] = mock_sdk
 sys.modules['claude_agent_sdk.types'] = mock_types
 
-# Add project to path
-sys.path.insert(0, '.')
-
 
 def run_async(coro):
     """Run an async function synchronously for testing."""
@@ -2,6 +2,8 @@
 """Unit tests for wp_supervisor/reviewer.py"""
 
 import asyncio
+import functools
+import inspect
 import os
 import sys
 import tempfile
@@ -14,7 +16,6 @@ mock_sdk.ClaudeSDKClient = MagicMock()
 mock_sdk.ClaudeAgentOptions = MagicMock()
 sys.modules['claude_agent_sdk'] = mock_sdk
 
-sys.path.insert(0, '.')
 from wp_supervisor.reviewer import (
     ReviewerAgent,
     ReviewerState,
@@ -23,11 +24,20 @@ from wp_supervisor.reviewer import (
 )
 
 
-@pytest.fixture(autouse=True)
-def clean_supervisor_env(monkeypatch):
-    for key in list(os.environ):
-        if key.startswith("WP_SUPERVISOR_"):
-            monkeypatch.delenv(key, raising=False)
+@pytest.fixture(autouse=True, scope="module")
+def clean_supervisor_env():
+    # Module scope: nothing in this module sets WP_SUPERVISOR_* vars, so one
+    # snapshot/restore around the whole module is enough.
+    with pytest.MonkeyPatch.context() as mp:
+        for key in list(os.environ):
+            if key.startswith("WP_SUPERVISOR_"):
+                mp.delenv(key, raising=False)
+        yield
+
+
+# Members under test are the same objects in every test, so cache introspection
+_sig = functools.cache(inspect.signature)
+_isc = functools.cache(inspect.iscoroutinefunction)
 
 
 def run_async(coro):
@@ -107,64 +117,33 @@ class TestReviewerAgentInit:
         assert ReviewerAgent is not None
 
     def test_reviewer_agent_init_requires_expected_params(self):
-        import inspect
-        params = inspect.signature(ReviewerAgent.__init__).parameters
+        params = _sig(ReviewerAgent.__init__).parameters
         assert 'logger' in params
         assert 'requirements_summary' in params
         assert 'working_dir' in params
 
 
-class TestReviewerAgentState:
-
-    def test_state_property_exists(self):
-        assert hasattr(ReviewerAgent, 'state')
-
-
-class TestReviewerAgentStart:
-
-    def test_start_method_exists(self):
-        assert hasattr(ReviewerAgent, 'start')
+class TestReviewerAgentInterface:
 
-    def test_start_is_async(self):
-        import inspect
-        assert inspect.iscoroutinefunction(ReviewerAgent.start)
-
-
-class TestReviewerAgentReview:
-
-    def test_review_method_exists(self):
-        assert hasattr(ReviewerAgent, 'review')
-
-    def test_review_is_async(self):
-        import inspect
-        assert inspect.iscoroutinefunction(ReviewerAgent.review)
+    @pytest.mark.parametrize("name,is_async", [
+        ("state", False),
+        ("start", True),
+        ("review", True),
+        ("format_feedback", False),
+        ("stop", True),
+    ])
+    def test_member_exists(self, name, is_async):
+        assert hasattr(ReviewerAgent, name)
+        assert _isc(getattr(ReviewerAgent, name)) is is_async
 
     def test_review_accepts_context_parameter(self):
-        import inspect
-        assert 'context' in inspect.signature(ReviewerAgent.review).parameters
-
-
-class TestReviewerAgentFormatFeedback:
-
-    def test_format_feedback_method_exists(self):
-        assert hasattr(ReviewerAgent, 'format_feedback')
+        assert 'context' in _sig(ReviewerAgent.review).parameters
 
     def test_format_feedback_accepts_required_params(self):
-        import inspect
-        params = inspect.signature(ReviewerAgent.format_feedback).parameters
+        params = _sig(ReviewerAgent.format_feedback).parameters
         assert 'result' in params
 
 
-class TestReviewerAgentStop:
-
-    def test_stop_method_exists(self):
-        assert hasattr(ReviewerAgent, 'stop')
-
-    def test_stop_is_async(self):
-        import inspect
-        assert inspect.iscoroutinefunction(ReviewerAgent.stop)
-
-
 # --- Behavioral Tests ---
 
 class TestReviewerAgentBehavior:
@@ -183,24 +162,6 @@ class TestReviewerAgentBehavior:
             )
             assert reviewer.state == ReviewerState.INITIALIZING
 
-    def test_start_transitions_to_ready_on_success(self):
-        assert hasattr(ReviewerAgent, 'start')
-
-    def test_start_transitions_to_degraded_on_failure(self):
-        assert hasattr(ReviewerAgent, 'start')
-
-    def test_review_returns_empty_result_when_degraded(self):
-        assert hasattr(ReviewerAgent, 'review')
-
-    def test_review_returns_empty_result_when_no_files_changed(self):
-        assert hasattr(ReviewerAgent, 'review')
-
-    def test_format_feedback_includes_issues(self):
-        assert hasattr(ReviewerAgent, 'format_feedback')
-
-    def test_stop_cleans_up_resources(self):
-        assert hasattr(ReviewerAgent, 'stop')
-
 
 class TestReviewerContextMinimalData:
 
@@ -12,8 +12,6 @@ import tempfile
 import pytest
 from unittest.mock import patch
 
-# Add the hooks/lib directory to the path
-sys.path.insert(0, 'hooks/lib')
 from settings_manager import (
     WP_PERMISSIONS,
     get_wp_hooks,
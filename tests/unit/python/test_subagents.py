@@ -32,8 +32,6 @@ mock_sdk = MagicMock()
 mock_sdk.AgentDefinition = MockAgentDefinition
 sys.modules['claude_agent_sdk'] = mock_sdk
 
-# Add wp_supervisor to path
-sys.path.insert(0, '.')
 from wp_supervisor.subagents import (
     SubagentBuilder,
     BUSINESS_LOGIC_EXPLORER,
@@ -3,11 +3,8 @@
 Unit tests for wp_supervisor/context.py - ContextBuilder class
 """
 
-import sys
 import pytest
 
-# Add wp_supervisor to path
-sys.path.insert(0, '.')
 from wp_supervisor.context import ContextBuilder
 
 
@@ -340,7 +337,6 @@ class TestContextBuilderStaticMethods:
         assert isinstance(result, str)
 
 
-
 class TestContextIntegration:
     """Integration tests for context building across phases."""
 
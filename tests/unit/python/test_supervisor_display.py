@@ -49,7 +49,6 @@ mock_sdk.types = mock_types
 sys.modules['claude_agent_sdk'] = mock_sdk
 sys.modules['claude_agent_sdk.types'] = mock_types
 
-sys.path.insert(0, '.')
 from wp_supervisor.display import SupervisorDisplay, HAS_RICH
 
 
@@ -342,6 +342,13 @@ class TestBuildVerifyHook:
             result = run_async(hooks.build_verify(input_data, None, None))
             assert result == {}
 
+    def test_run_command_interleaves_stdout_and_stderr(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            hooks = self._create_hooks_with_config(2, tmpdir)
+            code, out = hooks._run_command("echo first; echo second >&2; echo third", tmpdir)
+            assert code == 0
+            assert out.split() == ["first", "second", "third"]
+
     def test_phase2_runs_compile_command(self):
         with tempfile.TemporaryDirectory() as tmpdir:
             hooks = self._create_hooks_with_config(2, tmpdir)
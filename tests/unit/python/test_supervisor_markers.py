@@ -4,15 +4,12 @@ Unit tests for wp_supervisor/markers.py - SupervisorMarkers class
 """
 
 import os
-import sys
 import tempfile
 import pytest
 from pathlib import Path
 from unittest.mock import patch
 from datetime import datetime
 
-# Add wp_supervisor to path
-sys.path.insert(0, '.')
 from wp_supervisor.markers import SupervisorMarkers
 
 
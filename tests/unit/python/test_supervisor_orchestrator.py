@@ -83,7 +83,6 @@ mock_sdk.types = mock_types
 sys.modules['claude_agent_sdk'] = mock_sdk
 sys.modules['claude_agent_sdk.types'] = mock_types
 
-sys.path.insert(0, '.')
 from wp_supervisor.markers import SupervisorMarkers
 from wp_supervisor.context import ContextBuilder
 from wp_supervisor.session import read_user_input
@@ -57,8 +57,6 @@ mock_sdk.types = mock_types
 sys.modules['claude_agent_sdk'] = mock_sdk
 sys.modules['claude_agent_sdk.types'] = mock_types
 
-# Add wp_supervisor to path
-sys.path.insert(0, '.')
 from wp_supervisor.session import (
     read_user_input,
     SessionRunner,
@@ -6,8 +6,6 @@ Unit tests for wp_supervisor/templates.py - Prompt templates and formatting func
 import sys
 import pytest
 
-# Add wp_supervisor to path
-sys.path.insert(0, '.')
 from wp_supervisor import templates
 
 
@@ -360,6 +358,24 @@ class TestStagedKnowledgeFormatting:
         assert "Service Mesh" in result
         assert result != "None yet"
 
+    @pytest.mark.parametrize("content,expected", [
+        ("First part. Second part.", "First part."),
+        ("First line.\nSecond line", "First line."),
+        ("Version 1.2 is pinned", "Version 1."),
+        ("No terminator", "No terminator"),
+    ])
+    def test_format_staged_knowledge_uses_first_sentence(self, content, expected):
+        # given
+        from wp_knowledge import StagedKnowledge, StagedKnowledgeEntry
+
+        staged = StagedKnowledge(decisions=[StagedKnowledgeEntry("Title", content, 1)])
+
+        # when
+        result = templates.format_staged_knowledge_for_prompt(staged)
+
+        # then
+        assert result == f"DECISIONS:\n- Title: {expected}"
+
 
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
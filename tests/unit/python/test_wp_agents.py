@@ -4,14 +4,11 @@ Unit tests for wp_agents.py
 """
 
 import os
-import sys
 import tempfile
 import pytest
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 
-# Add hooks/lib to path
-sys.path.insert(0, 'hooks/lib')
 from wp_agents import AgentLoader
 
 
@@ -15,8 +15,6 @@ import pytest
 from pathlib import Path
 from unittest.mock import patch
 
-# Add hooks/lib to path
-sys.path.insert(0, 'hooks/lib')
 from wp_state import WPState
 
 
@@ -5,15 +5,11 @@ Unit tests for wp_config.py
 
 import json
 import os
-import sys
 import tempfile
 import pytest
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 
-# Add hooks/lib to path
-sys.path.insert(0, 'hooks/lib')
-
 from wp_config import WPConfig
 
 
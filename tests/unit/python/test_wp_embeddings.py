@@ -3,15 +3,12 @@
 Unit tests for wp_embeddings.py - Local RAG using sentence-transformers
 """
 
-import sys
 import tempfile
 import pytest
 import json
 from pathlib import Path
 from unittest.mock import patch, MagicMock, PropertyMock
 
-# Add hooks/lib to path
-sys.path.insert(0, 'hooks/lib')
 from wp_embeddings import (
     EmbeddingEntry,
     EmbeddingsModel,
@@ -3,15 +3,12 @@
 Unit tests for wp_graph.py - Graph storage for knowledge entries
 """
 
-import sys
 import tempfile
 import pytest
 import json
 from pathlib import Path
 from datetime import datetime
 
-# Add hooks/lib to path
-sys.path.insert(0, 'hooks/lib')
 from wp_graph import (
     NodeId,
     RelationshipType,
@@ -3,14 +3,11 @@
 Unit tests for wp_knowledge.py - Knowledge Management
 """
 
-import sys
 import tempfile
 import pytest
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 
-# Add hooks/lib to path
-sys.path.insert(0, 'hooks/lib')
 from wp_knowledge import ProjectIdentifier, KnowledgeManager
 
 
@@ -281,6 +278,44 @@ class TestKnowledgeManagerGraphIntegration:
                     # then
                     mock_graph_storage.load_project_graph.assert_called()
 
+    def test_graphs_are_reloaded_only_when_a_graph_file_changes(self):
+        # given
+        from wp_graph import GraphStorage, KnowledgeGraph
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with patch.object(ProjectIdentifier, 'get_project_id', return_value='test-project'):
+                storage = GraphStorage(Path(tmpdir))
+                storage.save_global_graph(KnowledgeGraph())
+                manager = KnowledgeManager(tmpdir, enable_graph=True, enable_rag=False)
+                manager.graph_storage = storage
+
+                with patch.object(storage, 'load_global_graph', wraps=storage.load_global_graph) as load:
+                    # when
+                    manager.load_knowledge_context()
+                    manager.load_knowledge_context()
+                    (Path(tmpdir) / "global-graph.json").write_text('{"nodes": {}, "edges": []}  ')
+                    manager.load_knowledge_context()
+
+                # then
+                assert load.call_count == 2
+
+    def test_setting_graph_storage_drops_loaded_graphs(self):
+        # given
+        from wp_graph import GraphStorage
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with patch.object(ProjectIdentifier, 'get_project_id', return_value='test-project'):
+                manager = KnowledgeManager(tmpdir, enable_graph=True, enable_rag=False)
+                manager.graph_storage = GraphStorage(Path(tmpdir) / "first")
+                manager.load_knowledge_context()
+                second = GraphStorage(Path(tmpdir) / "second")
+
+                # when
+                with patch.object(second, 'load_global_graph', wraps=second.load_global_graph) as load:
+                    manager.graph_storage = second
+                    manager.load_knowledge_context()
+
+                # then
+                load.assert_called_once()
+
     def test_load_knowledge_context_accepts_query_text_parameter(self):
         # given - [REQ-7] Query RAG with initial task description
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -4,15 +4,12 @@ Unit tests for wp_logging.py
 """
 
 import os
-import sys
 import tempfile
 import pytest
 from datetime import datetime
 from pathlib import Path
 from unittest.mock import patch
 
-# Add hooks/lib to path
-sys.path.insert(0, 'hooks/lib')
 from wp_logging import WPLogger
 
 
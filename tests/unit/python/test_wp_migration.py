@@ -3,13 +3,10 @@
 Unit tests for wp_migration.py - Migration utility to convert markdown to graph
 """
 
-import sys
 import tempfile
 import pytest
 from pathlib import Path
 
-# Add hooks/lib to path
-sys.path.insert(0, 'hooks/lib')
 from wp_migration import (
     MarkdownParser,
     KnowledgeMigrator,
@@ -33,6 +33,13 @@ class ContextBuilder:
     once at workflow start and passed to each build_phase*_context() method.
     """
 
+    @staticmethod
+    def _with_knowledge(context: str, knowledge_context: str) -> str:
+        """Append the shared knowledge section to a phase context, if provided."""
+        if not knowledge_context:
+            return context
+        return "\n\n".join((context, knowledge_context))
+
     @staticmethod
     def build_phase1_context(
         user_task: Optional[str] = None,
@@ -70,11 +77,7 @@ class ContextBuilder:
             # Supervisor fallback when subagent building fails
             context = PHASE1_SUPERVISOR_FALLBACK_CONTEXT.format(task_section=task_section)
 
-        # Inject knowledge context if provided
-        if knowledge_context:
-            context = f"{context}\n\n{knowledge_context}"
-
-        return context
+        return ContextBuilder._with_knowledge(context, knowledge_context)
 
     @staticmethod
     def build_phase2_context(
@@ -90,11 +93,7 @@ class ContextBuilder:
         """
         context = PHASE2_CONTEXT.format(requirements_summary=requirements_summary)
 
-        # Inject knowledge context if provided
-        if knowledge_context:
-            context = f"{context}\n\n{knowledge_context}"
-
-        return context
+        return ContextBuilder._with_knowledge(context, knowledge_context)
 
     @staticmethod
     def build_phase3_context(
@@ -115,11 +114,7 @@ class ContextBuilder:
             interfaces_list=interfaces_list
         )
 
-        # Inject knowledge context if provided
-        if knowledge_context:
-            context = f"{context}\n\n{knowledge_context}"
-
-        return context
+        return ContextBuilder._with_knowledge(context, knowledge_context)
 
     @staticmethod
     def build_phase4_context(
@@ -143,11 +138,7 @@ class ContextBuilder:
             tests_list=tests_list
         )
 
-        # Inject knowledge context if provided
-        if knowledge_context:
-            context = f"{context}\n\n{knowledge_context}"
-
-        return context
+        return ContextBuilder._with_knowledge(context, knowledge_context)
 
     @staticmethod
     def get_summary_prompt(phase: int) -> str:
@@ -158,10 +158,11 @@ class SupervisorHooks:
         import subprocess
         try:
             result = subprocess.run(
-                cmd, shell=True, capture_output=True, text=True,
+                cmd, shell=True,
+                stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True,
                 timeout=timeout, cwd=cwd
             )
-            return result.returncode, result.stdout + result.stderr
+            return result.returncode, result.stdout
         except subprocess.TimeoutExpired:
             return 1, f"Command timed out after {timeout} seconds"
         except Exception as e:
@@ -10,8 +10,9 @@ Also manages knowledge staging for supervisor-controlled knowledge extraction.
 
 import json
 import logging
+import os
 from pathlib import Path
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, List
 
 from wp_state import WPState
 from wp_knowledge import (
@@ -22,6 +23,33 @@ from wp_knowledge import (
     ExtractionResult,
 )
 
+try:
+    import orjson
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+    HAS_ORJSON = True
+except ImportError:
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj).encode()
+    _loads = json.loads
+    HAS_ORJSON = False
+
+
+def _dumps_line(obj) -> bytes:
+    """Encode one staged line; strings orjson rejects (e.g. lone surrogates) go through stdlib json."""
+    try:
+        return _dumps(obj)
+    except TypeError:
+        return json.dumps(obj).encode()
+
+
+def _loads_line(line: bytes):
+    """Decode one staged line, reading stdlib-escaped lone surrogates that orjson rejects."""
+    try:
+        return _loads(line)
+    except ValueError:
+        return json.loads(line)
+
 
 class SupervisorMarkers:
     """
@@ -282,13 +310,20 @@ class SupervisorMarkers:
 
     # --- Knowledge Staging [REQ-13, REQ-14, REQ-15, REQ-16] ---
 
-    STAGED_KNOWLEDGE_FILE = "staged-knowledge.json"
+    STAGED_KNOWLEDGE_FILE = "staged-knowledge.jsonl"
+
+    # Single-document format written before staging moved to JSON lines
+    LEGACY_STAGED_KNOWLEDGE_FILE = "staged-knowledge.json"
+
+    # Category of each staged line, matching the StagedKnowledge field names [REQ-14]
+    STAGED_CATEGORIES = ("architecture", "decisions", "lessons_learned")
 
     def stage_knowledge(self, knowledge: StagedKnowledge) -> None:
         """
         Stage extracted knowledge for later application.
 
-        Merges with any existing staged knowledge (accumulates across phases) [REQ-15].
+        Appends one JSON line per entry, so knowledge accumulates across phases
+        without re-reading what is already staged [REQ-15].
         Stored in workflow state directory [REQ-13].
 
         Args:
@@ -297,36 +332,77 @@ class SupervisorMarkers:
         Note:
             On file write failure: Logs error, continues workflow normally.
         """
-        # Load existing staged knowledge
-        existing_data = self._load_staged_knowledge_from_file()
-
-        # Merge new knowledge with existing [REQ-15]
-        for entry in knowledge.architecture:
-            existing_data["architecture"].append({
+        self._migrate_legacy_staged_knowledge()
+        self._append_staged_lines([
+            _dumps_line({
+                "category": category,
                 "title": entry.title,
                 "content": entry.content,
                 "phase": entry.phase,
                 "tag": entry.tag
             })
+            for category in self.STAGED_CATEGORIES
+            for entry in getattr(knowledge, category)
+        ])
 
-        for entry in knowledge.decisions:
-            existing_data["decisions"].append({
-                "title": entry.title,
-                "content": entry.content,
-                "phase": entry.phase,
-                "tag": entry.tag
-            })
+    def _append_staged_lines(self, lines: List[bytes]) -> bool:
+        """
+        Append encoded lines to the staged knowledge file.
 
-        for entry in knowledge.lessons_learned:
-            existing_data["lessons_learned"].append({
-                "title": entry.title,
-                "content": entry.content,
-                "phase": entry.phase,
-                "tag": entry.tag
-            })
+        Returns:
+            False if the write failed, True otherwise (including nothing to write)
+        """
+        if not lines:
+            return True
+
+        path = self._get_staged_knowledge_path()
+        try:
+            # Ensure directory exists
+            path.parent.mkdir(parents=True, exist_ok=True)
+
+            payload = b"\n".join(lines) + b"\n"
+            with open(path, 'a+b') as f:
+                # A crash mid-append can leave a torn last line; start on a
+                # fresh line so only that fragment is lost, not our first entry
+                if f.seek(0, os.SEEK_END) > 0:
+                    f.seek(-1, os.SEEK_END)
+                    if f.read(1) != b"\n":
+                        payload = b"\n" + payload
+                # One write of whole lines per call [ERR-2]
+                f.write(payload)
+        except IOError:
+            return False  # Caller continues workflow normally [ERR-2]
+        return True
+
+    def _migrate_legacy_staged_knowledge(self) -> None:
+        """
+        Move entries from a legacy staged-knowledge.json into the JSON lines file.
 
-        # Save merged data
-        self._save_staged_knowledge_to_file(existing_data)
+        Covers workflows that were in progress during an upgrade. The legacy
+        file is removed once its entries are appended, so this runs at most once.
+        """
+        legacy_path = Path(self.markers_dir) / self.LEGACY_STAGED_KNOWLEDGE_FILE
+        try:
+            with open(legacy_path, 'rb') as f:
+                data = json.loads(f.read())
+        except FileNotFoundError:
+            return
+        except (IOError, ValueError):
+            data = {}  # Unreadable legacy file holds nothing we can recover
+
+        if not isinstance(data, dict):
+            data = {}
+        lines = [
+            _dumps_line({"category": category, **e})
+            for category in self.STAGED_CATEGORIES
+            for e in data.get(category, [])
+            if isinstance(e, dict)
+        ]
+        if self._append_staged_lines(lines):
+            try:
+                legacy_path.unlink()
+            except OSError:
+                pass
 
     def get_staged_knowledge(self) -> StagedKnowledge:
         """
@@ -336,54 +412,47 @@ class SupervisorMarkers:
             StagedKnowledge container. Returns empty StagedKnowledge if
             no staged knowledge exists [EDGE-6].
         """
-        data = self._load_staged_knowledge_from_file()
-
-        # Convert JSON data to StagedKnowledgeEntry objects
-        architecture = [
-            StagedKnowledgeEntry(
-                title=e["title"],
-                content=e["content"],
-                phase=e["phase"],
-                tag=e.get("tag")
-            )
-            for e in data.get("architecture", [])
-        ]
+        self._migrate_legacy_staged_knowledge()
+        entries: Dict[str, List[StagedKnowledgeEntry]] = {
+            category: [] for category in self.STAGED_CATEGORIES
+        }
 
-        decisions = [
-            StagedKnowledgeEntry(
-                title=e["title"],
-                content=e["content"],
-                phase=e["phase"],
-                tag=e.get("tag")
-            )
-            for e in data.get("decisions", [])
-        ]
-
-        lessons_learned = [
-            StagedKnowledgeEntry(
-                title=e["title"],
-                content=e["content"],
-                phase=e["phase"],
-                tag=e.get("tag")
-            )
-            for e in data.get("lessons_learned", [])
-        ]
+        try:
+            with open(self._get_staged_knowledge_path(), 'rb') as f:
+                for line in f:
+                    try:
+                        e = _loads_line(line)
+                    except ValueError:
+                        continue  # Blank or torn line
+                    bucket = entries.get(e.get("category")) if isinstance(e, dict) else None
+                    if bucket is None:
+                        continue
+                    bucket.append(StagedKnowledgeEntry(
+                        title=e["title"],
+                        content=e["content"],
+                        phase=e["phase"],
+                        tag=e.get("tag")
+                    ))
+        except IOError:
+            pass  # No staged knowledge yet [EDGE-6]
 
-        return StagedKnowledge(
-            architecture=architecture,
-            decisions=decisions,
-            lessons_learned=lessons_learned
-        )
+        return StagedKnowledge(**entries)
 
     def has_staged_knowledge(self) -> bool:
         """
         Check if there is any staged knowledge.
 
+        stage_knowledge never writes an empty payload, so a non-empty file
+        means entries are staged; nothing is parsed.
+
         Returns:
             True if there are staged entries, False otherwise
         """
-        staged = self.get_staged_knowledge()
-        return not staged.is_empty()
+        self._migrate_legacy_staged_knowledge()
+        try:
+            return self._get_staged_knowledge_path().stat().st_size > 0
+        except OSError:
+            return False
 
     def clear_staged_knowledge(self) -> None:
         """
@@ -392,70 +461,18 @@ class SupervisorMarkers:
         Called after successful application at end of Phase 4,
         or on workflow abort.
         """
-        path = self._get_staged_knowledge_path()
-        if path.exists():
-            try:
-                path.unlink()
-            except IOError:
-                pass  # Ignore errors on cleanup
+        for path in (self._get_staged_knowledge_path(),
+                     Path(self.markers_dir) / self.LEGACY_STAGED_KNOWLEDGE_FILE):
+            if path.exists():
+                try:
+                    path.unlink()
+                except IOError:
+                    pass  # Ignore errors on cleanup
 
     def _get_staged_knowledge_path(self) -> Path:
         """Get path to staged knowledge file."""
         return Path(self.markers_dir) / self.STAGED_KNOWLEDGE_FILE
 
-    def _load_staged_knowledge_from_file(self) -> Dict[str, Any]:
-        """
-        Load staged knowledge from JSON file.
-
-        Returns:
-            Dict with structure matching [REQ-14], or empty dict if not exists
-        """
-        path = self._get_staged_knowledge_path()
-
-        if not path.exists():
-            # Return empty structure [EDGE-6]
-            return {
-                "architecture": [],
-                "decisions": [],
-                "lessons_learned": []
-            }
-
-        try:
-            with open(path, 'r') as f:
-                data = json.load(f)
-                # Ensure all keys exist
-                if "architecture" not in data:
-                    data["architecture"] = []
-                if "decisions" not in data:
-                    data["decisions"] = []
-                if "lessons_learned" not in data:
-                    data["lessons_learned"] = []
-                return data
-        except (IOError, json.JSONDecodeError):
-            return {
-                "architecture": [],
-                "decisions": [],
-                "lessons_learned": []
-            }
-
-    def _save_staged_knowledge_to_file(self, data: Dict[str, Any]) -> None:
-        """
-        Save staged knowledge to JSON file.
-
-        Args:
-            data: Dict with structure matching [REQ-14]
-        """
-        path = self._get_staged_knowledge_path()
-
-        try:
-            # Ensure directory exists
-            path.parent.mkdir(parents=True, exist_ok=True)
-
-            with open(path, 'w') as f:
-                json.dump(data, f, indent=2)
-        except IOError:
-            pass  # Log error but continue workflow normally [ERR-2]
-
     # --- Knowledge Application Integration ---
 
     def apply_staged_knowledge(self, project_dir: str = ".") -> Dict[str, int]:
@@ -1129,6 +1129,16 @@ GOOD LESSON: "[Kafka] Consumer deserializer must return null on failure to avoid
 # KNOWLEDGE FORMATTING FUNCTIONS
 # =============================================================================
 
+def _first_sentence(content: str) -> str:
+    """Extract first sentence from content (up to the first '. ', '.\n' or '.')."""
+    # Slice at the first terminator found rather than splitting the whole content
+    for end in ('. ', '.\n', '.'):
+        index = content.find(end)
+        if index != -1:
+            return content[:index] + '.'
+    return content
+
+
 def format_staged_knowledge_for_prompt(staged: "StagedKnowledge") -> str:
     """
     Format staged knowledge as concise list for extraction prompt.
@@ -1148,30 +1158,22 @@ def format_staged_knowledge_for_prompt(staged: "StagedKnowledge") -> str:
 
     lines = []
 
-    def get_first_sentence(content: str) -> str:
-        """Extract first sentence from content."""
-        # Split on period followed by space or end of string
-        for end in ['. ', '.\n', '.']:
-            if end in content:
-                return content.split(end)[0] + '.'
-        return content
-
     if staged.architecture:
         lines.append(f"{KnowledgeCategory.ARCHITECTURE.name}:")
         for entry in staged.architecture:
-            first_sentence = get_first_sentence(entry.content)
+            first_sentence = _first_sentence(entry.content)
             lines.append(f"- {entry.title}: {first_sentence}")
 
     if staged.decisions:
         lines.append(f"{KnowledgeCategory.DECISIONS.name}:")
         for entry in staged.decisions:
-            first_sentence = get_first_sentence(entry.content)
+            first_sentence = _first_sentence(entry.content)
             lines.append(f"- {entry.title}: {first_sentence}")
 
     if staged.lessons_learned:
         lines.append(f"{KnowledgeCategory.LESSONS_LEARNED.name}:")
         for entry in staged.lessons_learned:
-            first_sentence = get_first_sentence(entry.content)
+            first_sentence = _first_sentence(entry.content)
             tag = f"[{entry.tag}] " if entry.tag else ""
             lines.append(f"- {tag}{entry.title}: {first_sentence}")
 